@@ -0,0 +1,110 @@
+import numpy as np
+from numba import njit, prange
+
+
+# Kept in its own module so numba's on-disk cache (cache=True) survives
+# dashboard reloads and the kernel is compiled only once per environment.
+
+
+@njit(cache=True)
+def count_outcomes(labels, decisions):
+    """
+    Count stored-decision outcomes in a single pass.
+    
+    A genuine attempt is a false reject only when explicitly rejected, and an
+    impostor attempt a false accept only when explicitly accepted; any other
+    decision value counts as the correct outcome (as in compute_metrics).
+    
+    Args:
+        labels: int64 array of ground truth (1=genuine, 0=impostor, other=ignored)
+        decisions: int8 array of stored decisions (1=accept, 0=reject, other=unknown)
+        
+    Returns:
+        Tuple of (true_accepts, false_rejects, false_accepts, true_rejects)
+    """
+    true_accepts = 0
+    false_rejects = 0
+    false_accepts = 0
+    true_rejects = 0
+    
+    for i in range(labels.shape[0]):
+        if labels[i] == 1:
+            if decisions[i] == 0:
+                false_rejects += 1
+            else:
+                true_accepts += 1
+        elif labels[i] == 0:
+            if decisions[i] == 1:
+                false_accepts += 1
+            else:
+                true_rejects += 1
+    
+    return true_accepts, false_rejects, false_accepts, true_rejects
+
+
+@njit(cache=True)
+def classify_scores(scores, threshold, out_isnull, out_accept):
+    """
+    Apply the score threshold to produce accept/reject decisions in place.
+    
+    Args:
+        scores: float64 array of recognition scores (NaN for missing)
+        threshold: Decision threshold (score >= threshold is an accept)
+        out_isnull: bool array, set True where the score is missing
+        out_accept: bool array, set True where the score meets the threshold
+    """
+    for i in range(scores.shape[0]):
+        s = scores[i]
+        out_isnull[i] = np.isnan(s)
+        out_accept[i] = (not np.isnan(s)) and s >= threshold
+
+
+@njit(cache=True, parallel=True)
+def sweep_histograms(scores, labels, thresholds, n_chunks):
+    """
+    Bucket genuine and impostor scores by how many thresholds they meet.
+    
+    Each score's bucket is guessed from the grid spacing and then corrected by
+    stepping along the sorted thresholds, so it is exact for any sorted grid and
+    O(1) per score for evenly spaced (linspace) grids - no sort of the scores is
+    needed. Chunks of rows are processed in parallel, each into its own
+    histogram row, and summed at the end.
+    
+    Args:
+        scores: float array of recognition scores (NaN for missing, skipped)
+        labels: int64 array of ground truth (1=genuine, 0=impostor, other=ignored)
+        thresholds: Sorted thresholds, in the same dtype as scores
+        n_chunks: Number of row chunks to process in parallel
+        
+    Returns:
+        Tuple of (genuine, impostor) int64 arrays of length len(thresholds) + 1;
+        bucket k holds scores that are >= exactly the first k thresholds
+    """
+    n = scores.shape[0]
+    t = thresholds.shape[0]
+    buckets = t + 1
+    first = thresholds[0] if t else 0.0
+    step = (thresholds[t - 1] - first) / (t - 1) if t > 1 else 0.0
+    genuine = np.zeros((n_chunks, buckets), dtype=np.int64)
+    impostor = np.zeros((n_chunks, buckets), dtype=np.int64)
+    chunk_size = (n + n_chunks - 1) // n_chunks
+    
+    for c in prange(n_chunks):
+        for i in range(c * chunk_size, min(n, (c + 1) * chunk_size)):
+            s = scores[i]
+            if np.isnan(s):
+                continue
+            k = 0
+            if step > 0:
+                k = min(max(int((s - first) / step) + 1, 0), t)
+            # Settle on the exact count of thresholds <= s
+            while k < t and thresholds[k] <= s:
+                k += 1
+            while k > 0 and thresholds[k - 1] > s:
+                k -= 1
+            if labels[i] == 1:
+                genuine[c, k] += 1
+            elif labels[i] == 0:
+                impostor[c, k] += 1
+    
+    return genuine.sum(axis=0), impostor.sum(axis=0)
@@ -25,9 +25,13 @@ class DataCleaning:
         if df.empty or 'timestamp' not in df.columns:
             return df
         
+        # Loaders already return parsed timestamps; avoid re-parsing
+        if pd.api.types.is_datetime64_any_dtype(df['timestamp']):
+            return df
+        
         df = df.copy()
         try:
-            df['timestamp'] = pd.to_datetime(df['timestamp'])
+            df['timestamp'] = pd.to_datetime(df['timestamp'], format='ISO8601')
             self.logger.info("Timestamps normalized successfully")
         except Exception as e:
             self.logger.warning(f"Error normalizing timestamps: {e}")
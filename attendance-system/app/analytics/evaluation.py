@@ -2,6 +2,145 @@ import pandas as pd
 import numpy as np
 from app.utils.logging import setup_logger
 
+# Outcome names indexed by code (face_verified * 2 + accepted); unknown takes the last slot
+OUTCOME_NAMES = np.array(['true_reject', 'false_accept', 'false_reject', 'true_accept', 'unknown'])
+OUTCOME_UNKNOWN = 4
+
+# Above this many scores (and with more than one numba thread) the threshold
+# sweep uses the parallel numba kernel instead of sorting the scores
+SWEEP_NUMBA_MIN_ROWS = 1000
+
+
+def _sorted_sweep(scores, labels, thresholds):
+    """
+    Compute score-based FAR, FRR and accuracy at every threshold from a single sort.
+    
+    Genuine and impostor scores are sorted once; the number of each below a
+    threshold is then a binary search, so all thresholds are evaluated in
+    O((N + T) log N) rather than one pass over the scores per threshold.
+    NaN scores sort last, so they are never counted as below a threshold or
+    at/above it (as in compute_metrics).
+    
+    Args:
+        scores: Array of recognition scores (NaN allowed)
+        labels: int64 array of ground truth (1=genuine, 0=impostor, other=ignored)
+        thresholds: Array of thresholds, in the same dtype as scores
+        
+    Returns:
+        Tuple of (far, frr, accuracy) float64 arrays, one value per threshold
+    """
+    genuine_scores = np.sort(scores[labels == 1])
+    impostor_scores = np.sort(scores[labels == 0])
+    genuine_count = len(genuine_scores)
+    impostor_count = len(impostor_scores)
+    
+    false_rejects = np.searchsorted(genuine_scores, thresholds, side='left')
+    scored_impostors = impostor_count - np.count_nonzero(np.isnan(impostor_scores))
+    false_accepts = scored_impostors - np.searchsorted(impostor_scores, thresholds, side='left')
+    
+    far = false_accepts / impostor_count if impostor_count else np.zeros(len(thresholds))
+    frr = false_rejects / genuine_count if genuine_count else np.zeros(len(thresholds))
+    if len(scores):
+        accuracy = ((genuine_count - false_rejects) + (impostor_count - false_accepts)) / len(scores)
+    else:
+        accuracy = np.zeros(len(thresholds))
+    return far, frr, accuracy
+
+
+def _binned_sweep(scores, labels, thresholds):
+    """
+    Compute the same rates as _sorted_sweep with the parallel numba kernel.
+    
+    Scores are bucketed by how many (sorted) thresholds they meet, so a
+    cumulative sum of the buckets gives the counts below each threshold in
+    O(N log T) without sorting the scores.
+    
+    Args:
+        scores: Array of recognition scores (NaN allowed)
+        labels: int64 array of ground truth (1=genuine, 0=impostor, other=ignored)
+        thresholds: Sorted array of thresholds, in the same dtype as scores
+        
+    Returns:
+        Tuple of (far, frr, accuracy) float64 arrays, one value per threshold
+    """
+    # Imported here so the JIT compile/cache load is paid only by sweeps that need it
+    from numba import get_num_threads
+    from app.analytics._eer_kernel import sweep_histograms
+    
+    genuine_hist, impostor_hist = sweep_histograms(scores, labels, thresholds, get_num_threads())
+    # NaN genuine scores are never below a threshold, NaN impostor scores never at/above it
+    genuine_count = int(np.count_nonzero(labels == 1))
+    impostor_count = int(np.count_nonzero(labels == 0))
+    
+    false_rejects = np.cumsum(genuine_hist)[:-1]
+    false_accepts = impostor_hist.sum() - np.cumsum(impostor_hist)[:-1]
+    
+    far = false_accepts / impostor_count if impostor_count else np.zeros(len(thresholds))
+    frr = false_rejects / genuine_count if genuine_count else np.zeros(len(thresholds))
+    accuracy = ((genuine_count - false_rejects) + (impostor_count - false_accepts)) / len(scores)
+    return far, frr, accuracy
+
+
+def _eer_search(scores, labels, thresholds):
+    """
+    Binary-search a threshold grid for the point where FAR and FRR cross.
+    
+    With FAR and FRR rounded to 4 decimals (as in compute_metrics_sweep),
+    FAR - FRR never increases as the threshold rises, so the crossing is found
+    with O(log T) rate evaluations - each a binary search in the sorted scores -
+    instead of evaluating every threshold. The result is the same grid point as
+    taking the first minimum of |FAR - FRR| over the full sweep.
+    
+    Args:
+        scores: Array of recognition scores (NaN allowed)
+        labels: int64 array of ground truth (1=genuine, 0=impostor, other=ignored)
+        thresholds: Ascending array of thresholds, in the same dtype as scores
+        
+    Returns:
+        Tuple of (index, far, frr) for the EER threshold
+    """
+    genuine_scores = np.sort(scores[labels == 1])
+    impostor_scores = np.sort(scores[labels == 0])
+    genuine_count = len(genuine_scores)
+    impostor_count = len(impostor_scores)
+    scored_impostors = impostor_count - np.count_nonzero(np.isnan(impostor_scores))
+    
+    def rates(index):
+        threshold = thresholds[index]
+        false_rejects = np.searchsorted(genuine_scores, threshold, side='left')
+        false_accepts = scored_impostors - np.searchsorted(impostor_scores, threshold, side='left')
+        far = np.round(false_accepts / impostor_count, 4) if impostor_count else np.float64(0.0)
+        frr = np.round(false_rejects / genuine_count, 4) if genuine_count else np.float64(0.0)
+        return far, frr
+    
+    def first_at_or_below(value):
+        # First grid index whose FAR - FRR is <= value (len(thresholds) if none is)
+        low, high = 0, len(thresholds)
+        while low < high:
+            mid = (low + high) // 2
+            far, frr = rates(mid)
+            if far - frr <= value:
+                high = mid
+            else:
+                low = mid + 1
+        return low
+    
+    crossing = first_at_or_below(0.0)
+    best = min(crossing, len(thresholds) - 1)
+    if crossing > 0:
+        far, frr = rates(crossing - 1)
+        # Ties go to the lowest threshold, so step back to the start of that plateau
+        before = first_at_or_below(far - frr)
+        if crossing == len(thresholds):
+            best = before
+        else:
+            far_at, frr_at = rates(crossing)
+            if abs(far - frr) <= abs(far_at - frr_at):
+                best = before
+    
+    far, frr = rates(best)
+    return best, far, frr
+
 
 class AttendanceEvaluation:
     """
@@ -81,44 +220,20 @@ class AttendanceEvaluation:
             # Ground truth: face_verified (1=genuine, 0=impostor)
             # System decision: accept or reject (stored in system_decision)
             
-            # Normalize system_decision to lowercase for comparison
-            df['system_decision_lower'] = df['system_decision'].astype(str).str.lower().str.strip()
+            from app.analytics._eer_kernel import count_outcomes
             
-            # Genuine attempts
-            if genuine_count > 0:
-                genuine_df = df[df['face_verified'] == 1]
-                # False Rejects: Genuine attempts that were rejected
-                false_rejects = len(genuine_df[genuine_df['system_decision_lower'] == 'reject'])
-                # True Accepts: Genuine attempts that were accepted
-                true_accepts = genuine_count - false_rejects
-                FRR = false_rejects / genuine_count if genuine_count > 0 else 0.0
-            else:
-                false_rejects = 0
-                true_accepts = 0
-                FRR = 0.0
+            # Normalize system_decision to codes for comparison: 1=accept, 0=reject, -1=other
+            decision_lower = df['system_decision'].astype(str).str.lower().str.strip()
+            decisions = decision_lower.map({'accept': 1, 'reject': 0}).fillna(-1).to_numpy(dtype=np.int8)
+            labels = df['face_verified'].to_numpy(dtype=np.int64, na_value=-1)
             
-            # Impostor attempts
-            if impostor_count > 0:
-                impostor_df = df[df['face_verified'] == 0]
-                # False Accepts: Impostor attempts that were accepted
-                false_accepts = len(impostor_df[impostor_df['system_decision_lower'] == 'accept'])
-                # True Rejects: Impostor attempts that were rejected
-                true_rejects = impostor_count - false_accepts
-                FAR = false_accepts / impostor_count if impostor_count > 0 else 0.0
-            else:
-                false_accepts = 0
-                true_rejects = 0
-                FAR = 0.0
+            # False Rejects: genuine + reject; False Accepts: impostor + accept (one pass)
+            true_accepts, false_rejects, false_accepts, true_rejects = count_outcomes(labels, decisions)
             
-            # Use the most common threshold_used (or provided threshold as fallback)
-            if 'threshold_used' in df.columns:
-                threshold_used = df['threshold_used'].mode()
-                if len(threshold_used) > 0:
-                    threshold = float(threshold_used.iloc[0])
-                else:
-                    threshold = df['threshold_used'].median()
-                    if pd.isna(threshold):
-                        threshold = threshold  # Use provided threshold
+            FRR = false_rejects / genuine_count if genuine_count > 0 else 0.0
+            FAR = false_accepts / impostor_count if impostor_count > 0 else 0.0
+            
+            threshold = self._stored_threshold(df, threshold)
         else:
             # Fallback: Use score-based evaluation (for backward compatibility)
             if 'recognition_score' not in df.columns:
@@ -180,10 +295,140 @@ class AttendanceEvaluation:
             "true_rejects": true_rejects
         }
 
+    def _stored_threshold(self, df: pd.DataFrame, threshold: float):
+        """
+        Threshold to report for stored decisions: the most common threshold_used.
+        
+        Args:
+            df: DataFrame with a 'threshold_used' column
+            threshold: Fallback when no threshold_used value is set
+            
+        Returns:
+            Threshold value
+        """
+        threshold_used = df['threshold_used'].mode()
+        if len(threshold_used) > 0:
+            return float(threshold_used.iloc[0])
+        
+        median = df['threshold_used'].median()
+        return threshold if pd.isna(median) else median
+
+    def compute_metrics_both(self, df: pd.DataFrame, threshold: float = 0.5):
+        """
+        Compute metrics from stored decisions and from scores at a threshold in one pass.
+        
+        Equivalent to calling compute_metrics with use_stored_decision=True and then
+        False, but labels are extracted once and neither call splits the DataFrame.
+        
+        Args:
+            df: DataFrame with attendance records
+            threshold: Similarity score threshold (0.0 to 1.0) for the score-based result
+            
+        Returns:
+            Tuple of (stored-decision metrics, score-based metrics) dictionaries
+        """
+        required = {'face_verified', 'recognition_score', 'system_decision', 'threshold_used'}
+        if df.empty or not required.issubset(df.columns):
+            return (
+                self.compute_metrics(df, threshold, use_stored_decision=True),
+                self.compute_metrics(df, threshold, use_stored_decision=False)
+            )
+        
+        from app.analytics._eer_kernel import count_outcomes
+        
+        threshold = max(0.0, min(1.0, threshold))
+        scores, labels = self._score_arrays(df)
+        total_attempts = len(df)
+        genuine_count = int((labels == 1).sum())
+        impostor_count = int((labels == 0).sum())
+        
+        # Decision codes for both sources: 1=accept, 0=reject, -1=unknown (missing score/decision)
+        decision_lower = df['system_decision'].astype(str).str.lower().str.strip()
+        stored_decisions = decision_lower.map({'accept': 1, 'reject': 0}).fillna(-1).to_numpy(dtype=np.int8)
+        score_decisions = np.where(scores >= threshold, 1, np.where(scores < threshold, 0, -1)).astype(np.int8)
+        
+        results = []
+        for decisions, result_threshold in (
+            (stored_decisions, self._stored_threshold(df, threshold)),
+            (score_decisions, threshold)
+        ):
+            true_accepts, false_rejects, false_accepts, true_rejects = count_outcomes(labels, decisions)
+            FRR = false_rejects / genuine_count if genuine_count > 0 else 0.0
+            FAR = false_accepts / impostor_count if impostor_count > 0 else 0.0
+            accuracy = (true_accepts + true_rejects) / total_attempts
+            results.append({
+                "threshold": result_threshold,
+                "FAR": round(FAR, 4),
+                "FRR": round(FRR, 4),
+                "accuracy": round(accuracy, 4),
+                "total_attempts": total_attempts,
+                "genuine_attempts": genuine_count,
+                "impostor_attempts": impostor_count,
+                "false_accepts": false_accepts,
+                "false_rejects": false_rejects,
+                "true_accepts": true_accepts,
+                "true_rejects": true_rejects
+            })
+        
+        return tuple(results)
+
+    def _score_arrays(self, df: pd.DataFrame):
+        """
+        Extract recognition scores and ground-truth labels as numpy arrays.
+        
+        Scores keep their own precision so float32 scores meet thresholds exactly
+        as in compute_metrics (Arrow-backed columns expose their numpy equivalent
+        via numpy_dtype); missing labels become -1 and are ignored.
+        
+        Returns:
+            Tuple of (scores, labels) arrays
+        """
+        scores = self._scores(df)
+        labels = df['face_verified'].to_numpy(dtype=np.int64, na_value=-1)
+        return scores, labels
+
+    def _scores(self, df: pd.DataFrame):
+        """
+        Recognition scores as a float32 or float64 numpy array (NaN for missing).
+        
+        Args:
+            df: DataFrame with a 'recognition_score' column
+            
+        Returns:
+            Scores array in the column's own precision
+        """
+        source_dtype = getattr(df['recognition_score'].dtype, 'numpy_dtype', df['recognition_score'].dtype)
+        score_dtype = np.float32 if source_dtype == np.float32 else np.float64
+        return df['recognition_score'].to_numpy(dtype=score_dtype, na_value=np.nan)
+
+    def _score_decisions(self, df: pd.DataFrame, threshold):
+        """
+        Accept/reject decisions from recognition_score >= threshold.
+        
+        The threshold is cast to the score precision first, so a float32 score
+        exactly at its threshold is accepted (as in compute_metrics); missing
+        scores compare False and are rejected.
+        
+        Args:
+            df: DataFrame with a 'recognition_score' column
+            threshold: Scalar threshold or per-row thresholds
+            
+        Returns:
+            Array of 'accept'/'reject' strings
+        """
+        scores = self._scores(df)
+        thresholds = np.asarray(threshold, dtype=scores.dtype)
+        return np.where(scores >= thresholds, 'accept', 'reject')
+
     def compute_metrics_sweep(self, df: pd.DataFrame, num_thresholds: int = 50):
         """
         Compute FAR and FRR across a range of thresholds.
         
+        Decisions are made by comparing recognition_score against each threshold
+        (stored system decisions are fixed and cannot vary with the threshold).
+        The result can be passed as precomputed= to find_eer_threshold and the
+        curve plots so the sweep is done only once.
+        
         Args:
             df: DataFrame with attendance records
             num_thresholds: Number of threshold points to evaluate (default: 50)
@@ -191,30 +436,35 @@ class AttendanceEvaluation:
         Returns:
             DataFrame with columns: threshold, FAR, FRR, accuracy
         """
-        if df.empty:
+        if df.empty or 'recognition_score' not in df.columns or 'face_verified' not in df.columns:
             return pd.DataFrame(columns=['threshold', 'FAR', 'FRR', 'accuracy'])
         
         thresholds = np.linspace(0.0, 1.0, num_thresholds)
-        results = []
-        
-        for threshold in thresholds:
-            metrics = self.compute_metrics(df, threshold)
-            results.append({
-                'threshold': threshold,
-                'FAR': metrics['FAR'],
-                'FRR': metrics['FRR'],
-                'accuracy': metrics['accuracy']
-            })
-        
-        return pd.DataFrame(results)
+        scores, labels = self._score_arrays(df)
+        
+        sweep = _sorted_sweep
+        if len(scores) > SWEEP_NUMBA_MIN_ROWS:
+            from numba import get_num_threads
+            # On a single thread numpy's vectorized sort is as fast as the kernel
+            if get_num_threads() > 1:
+                sweep = _binned_sweep
+        far, frr, accuracy = sweep(scores, labels, thresholds.astype(scores.dtype))
+        
+        return pd.DataFrame({
+            'threshold': thresholds,
+            'FAR': far.round(4),
+            'FRR': frr.round(4),
+            'accuracy': accuracy.round(4)
+        })
 
-    def find_eer_threshold(self, df: pd.DataFrame, num_thresholds: int = 100):
+    def find_eer_threshold(self, df: pd.DataFrame, num_thresholds: int = 100, precomputed: pd.DataFrame = None):
         """
         Find the Equal Error Rate (EER) threshold where FAR = FRR.
         
         Args:
             df: DataFrame with attendance records
             num_thresholds: Number of threshold points to evaluate
+            precomputed: Optional result of compute_metrics_sweep to reuse instead of sweeping again
             
         Returns:
             Dictionary with EER threshold, EER value, and metrics at that threshold
@@ -227,28 +477,44 @@ class AttendanceEvaluation:
                 "FRR_at_eer": 0.0
             }
         
-        sweep_df = self.compute_metrics_sweep(df, num_thresholds)
-        
-        if sweep_df.empty:
-            return {
-                "eer_threshold": 0.5,
-                "eer_value": 0.0,
-                "FAR_at_eer": 0.0,
-                "FRR_at_eer": 0.0
-            }
-        
-        # Find threshold where FAR and FRR are closest
-        sweep_df['far_frr_diff'] = abs(sweep_df['FAR'] - sweep_df['FRR'])
-        eer_row = sweep_df.loc[sweep_df['far_frr_diff'].idxmin()]
+        if precomputed is not None:
+            if precomputed.empty:
+                return {
+                    "eer_threshold": 0.5,
+                    "eer_value": 0.0,
+                    "FAR_at_eer": 0.0,
+                    "FRR_at_eer": 0.0
+                }
+            
+            # Find threshold where FAR and FRR are closest
+            # (computed aside so a shared precomputed sweep is left untouched)
+            far_frr_diff = (precomputed['FAR'] - precomputed['FRR']).abs()
+            eer_row = precomputed.loc[far_frr_diff.idxmin()]
+            eer_threshold = eer_row['threshold']
+            far_at_eer = eer_row['FAR']
+            frr_at_eer = eer_row['FRR']
+        else:
+            if 'recognition_score' not in df.columns or 'face_verified' not in df.columns:
+                return {
+                    "eer_threshold": 0.5,
+                    "eer_value": 0.0,
+                    "FAR_at_eer": 0.0,
+                    "FRR_at_eer": 0.0
+                }
+            
+            # Binary search over the same grid a full sweep would use
+            thresholds = np.linspace(0.0, 1.0, num_thresholds)
+            scores, labels = self._score_arrays(df)
+            index, far_at_eer, frr_at_eer = _eer_search(scores, labels, thresholds.astype(scores.dtype))
+            eer_threshold = thresholds[index]
         
-        eer_threshold = eer_row['threshold']
-        eer_value = (eer_row['FAR'] + eer_row['FRR']) / 2
+        eer_value = (far_at_eer + frr_at_eer) / 2
         
         return {
             "eer_threshold": round(eer_threshold, 4),
             "eer_value": round(eer_value, 4),
-            "FAR_at_eer": round(eer_row['FAR'], 4),
-            "FRR_at_eer": round(eer_row['FRR'], 4)
+            "FAR_at_eer": round(far_at_eer, 4),
+            "FRR_at_eer": round(frr_at_eer, 4)
         }
 
     def get_score_statistics(self, df: pd.DataFrame):
@@ -273,31 +539,31 @@ class AttendanceEvaluation:
         impostor_stats = {}
         
         if len(genuine) > 0 and 'recognition_score' in genuine.columns:
-            genuine_scores = genuine['recognition_score'].dropna()
+            genuine_scores = self._reporting_scores(genuine['recognition_score'])
             if len(genuine_scores) > 0:
                 genuine_stats = {
                     "count": len(genuine_scores),
-                    "mean": round(genuine_scores.mean(), 4),
-                    "median": round(genuine_scores.median(), 4),
-                    "std": round(genuine_scores.std(), 4),
-                    "min": round(genuine_scores.min(), 4),
-                    "max": round(genuine_scores.max(), 4),
-                    "q25": round(genuine_scores.quantile(0.25), 4),
-                    "q75": round(genuine_scores.quantile(0.75), 4)
+                    "mean": round(float(genuine_scores.mean()), 4),
+                    "median": round(float(genuine_scores.median()), 4),
+                    "std": round(float(genuine_scores.std()), 4),
+                    "min": round(float(genuine_scores.min()), 4),
+                    "max": round(float(genuine_scores.max()), 4),
+                    "q25": round(float(genuine_scores.quantile(0.25)), 4),
+                    "q75": round(float(genuine_scores.quantile(0.75)), 4)
                 }
         
         if len(impostor) > 0 and 'recognition_score' in impostor.columns:
-            impostor_scores = impostor['recognition_score'].dropna()
+            impostor_scores = self._reporting_scores(impostor['recognition_score'])
             if len(impostor_scores) > 0:
                 impostor_stats = {
                     "count": len(impostor_scores),
-                    "mean": round(impostor_scores.mean(), 4),
-                    "median": round(impostor_scores.median(), 4),
-                    "std": round(impostor_scores.std(), 4),
-                    "min": round(impostor_scores.min(), 4),
-                    "max": round(impostor_scores.max(), 4),
-                    "q25": round(impostor_scores.quantile(0.25), 4),
-                    "q75": round(impostor_scores.quantile(0.75), 4)
+                    "mean": round(float(impostor_scores.mean()), 4),
+                    "median": round(float(impostor_scores.median()), 4),
+                    "std": round(float(impostor_scores.std()), 4),
+                    "min": round(float(impostor_scores.min()), 4),
+                    "max": round(float(impostor_scores.max()), 4),
+                    "q25": round(float(impostor_scores.quantile(0.25)), 4),
+                    "q75": round(float(impostor_scores.quantile(0.75)), 4)
                 }
         
         return {
@@ -305,6 +571,25 @@ class AttendanceEvaluation:
             "impostor": impostor_stats
         }
 
+    def _reporting_scores(self, scores: pd.Series):
+        """
+        Non-missing scores as float64 for reported statistics.
+        
+        float32 loads cannot represent stored decimals exactly, which is enough to
+        move a rounded quantile by one in the last place. Scores are in [0, 1], so
+        rounding the upcast values to 6 decimals (within float32 precision)
+        recovers the stored values and the statistics match a float64 load.
+        
+        Args:
+            scores: recognition_score Series
+            
+        Returns:
+            float64 Series without missing values
+        """
+        source_dtype = getattr(scores.dtype, 'numpy_dtype', scores.dtype)
+        scores = scores.dropna().astype('float64')
+        return scores.round(6) if source_dtype == np.float32 else scores
+
     def validate_outcomes(self, df: pd.DataFrame):
         """
         Validate the 4 outcomes (True Accept, False Reject, False Accept, True Reject)
@@ -328,10 +613,7 @@ class AttendanceEvaluation:
             if 'threshold_used' in df.columns and 'recognition_score' in df.columns:
                 from app.config.settings import SIMILARITY_THRESHOLD
                 df['threshold_used'] = df['threshold_used'].fillna(SIMILARITY_THRESHOLD)
-                df['system_decision'] = df.apply(
-                    lambda row: 'accept' if pd.notna(row['recognition_score']) and row['recognition_score'] >= row['threshold_used'] else 'reject',
-                    axis=1
-                )
+                df['system_decision'] = self._score_decisions(df, df['threshold_used'])
             else:
                 return df
         
@@ -347,21 +629,19 @@ class AttendanceEvaluation:
             # Compute from score if not available
             from app.config.settings import SIMILARITY_THRESHOLD
             threshold = df['threshold_used'].fillna(SIMILARITY_THRESHOLD) if 'threshold_used' in df.columns else SIMILARITY_THRESHOLD
-            df['system_decision_lower'] = df.apply(
-                lambda row: 'accept' if pd.notna(row['recognition_score']) and row['recognition_score'] >= threshold else 'reject',
-                axis=1
-            )
+            df['system_decision_lower'] = self._score_decisions(df, threshold)
         
-        # Validate outcomes
-        conditions = [
-            (df['ground_truth'] == 'genuine') & (df['system_decision_lower'] == 'accept'),
-            (df['ground_truth'] == 'genuine') & (df['system_decision_lower'] == 'reject'),
-            (df['ground_truth'] == 'impostor') & (df['system_decision_lower'] == 'accept'),
-            (df['ground_truth'] == 'impostor') & (df['system_decision_lower'] == 'reject')
-        ]
+        # Validate outcomes: code = ground truth * 2 + accepted, so each outcome is one integer
+        genuine = df['ground_truth'].to_numpy() == 'genuine'
+        known_truth = genuine | (df['ground_truth'].to_numpy() == 'impostor')
+        accepted = df['system_decision_lower'].to_numpy() == 'accept'
+        known_decision = accepted | (df['system_decision_lower'].to_numpy() == 'reject')
         
-        outcomes = ['true_accept', 'false_reject', 'false_accept', 'true_reject']
-        df['outcome'] = np.select(conditions, outcomes, default='unknown')
+        codes = genuine.astype(np.int8) * 2 + accepted.astype(np.int8)
+        codes[~(known_truth & known_decision)] = OUTCOME_UNKNOWN
+        df['outcome_code'] = codes
+        # Categorical over the same codes, so later comparisons on outcome are integer compares
+        df['outcome'] = pd.Categorical.from_codes(codes, categories=OUTCOME_NAMES)
         
         return df
 
@@ -397,7 +677,11 @@ class AttendanceEvaluation:
                 'unknown': 0
             }
         
-        counts = df['outcome'].value_counts().to_dict()
+        if 'outcome_code' in df.columns:
+            # One counting pass over the integer codes set by validate_outcomes
+            counts = dict(zip(OUTCOME_NAMES, np.bincount(df['outcome_code'].to_numpy(), minlength=len(OUTCOME_NAMES)).tolist()))
+        else:
+            counts = df['outcome'].value_counts().to_dict()
         return {
             'true_accept': counts.get('true_accept', 0),
             'false_reject': counts.get('false_reject', 0),
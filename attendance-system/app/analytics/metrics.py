@@ -1,8 +1,73 @@
+import math
 import pandas as pd
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from app.config.paths import EXPORTS_DIR
 from app.database.db_manager import DatabaseManager
 from app.utils.logging import setup_logger
 
+# Quantiles reported by score_statistics_sql (median, q25, q75)
+QUANTILES = (0.25, 0.5, 0.75)
+
+# On-disk Parquet cache for load_attendance(use_cache=True)
+ATTENDANCE_CACHE_DIR = EXPORTS_DIR / ".cache"
+
+
+# Columns load_attendance can return, mapped to their source (attendance 'a', users 'u')
+ATTENDANCE_COLUMNS = {
+    'id': 'a.id',
+    'user_id': 'a.user_id',
+    'name': 'u.name',
+    'role': 'u.role',
+    'recognition_score': 'a.recognition_score',
+    'face_verified': 'a.face_verified',
+    'liveness_verified': 'a.liveness_verified',
+    'threshold_used': 'a.threshold_used',
+    'system_decision': 'a.system_decision',
+    'timestamp': 'a.timestamp'
+}
+
+
+def _as_date(value):
+    """
+    Coerce a date filter (date, datetime or 'YYYY-MM-DD...' string) to a date.
+    """
+    if isinstance(value, str):
+        return date.fromisoformat(value[:10])
+    if isinstance(value, datetime):
+        return value.date()
+    return value
+
+
+def timestamp_range_filter(start_date=None, end_date=None, column='a.timestamp'):
+    """
+    Build an inclusive day-range filter that compares the raw timestamp column.
+    
+    Timestamps are stored as ISO text, so a half-open range on the bare column
+    (>= start day, < day after end) matches the same rows as DATE(column) between
+    the two days while still letting SQLite range-scan idx_attendance_timestamp.
+    
+    Args:
+        start_date: Optional first day to include (date, datetime or string)
+        end_date: Optional last day to include (date, datetime or string)
+        column: Timestamp column expression
+        
+    Returns:
+        Tuple of (sql fragment starting with ' AND', params list)
+    """
+    sql = ""
+    params = []
+    
+    if start_date:
+        sql += f" AND {column} >= ?"
+        params.append(_as_date(start_date).isoformat())
+    
+    if end_date:
+        sql += f" AND {column} < ?"
+        params.append((_as_date(end_date) + timedelta(days=1)).isoformat())
+    
+    return sql, params
+
 
 class AttendanceMetrics:
     """
@@ -14,7 +79,84 @@ class AttendanceMetrics:
         self.db = DatabaseManager()
         self.logger = setup_logger()
 
-    def load_attendance(self, start_date=None, end_date=None, user_id=None):
+    def _attendance_filters(self, start_date=None, end_date=None, user_id=None):
+        """
+        Build the WHERE fragment shared by attendance queries (table aliased as 'a').
+        
+        Args:
+            start_date: Optional start date filter (datetime or date)
+            end_date: Optional end date filter (datetime or date)
+            user_id: Optional user ID filter
+            
+        Returns:
+            Tuple of (sql fragment starting with ' AND', params list)
+        """
+        sql, params = timestamp_range_filter(start_date, end_date)
+        
+        if user_id:
+            sql += " AND a.user_id = ?"
+            params.append(user_id)
+        
+        return sql, params
+
+    def _cache_path(self, query, params, dtype_backend):
+        """
+        Parquet cache file for a load_attendance query against the database's current state.
+        
+        The key covers the database file and its WAL (committed writes can live only in
+        the WAL until a checkpoint), so any write makes earlier cache files miss.
+        
+        Args:
+            query: Final SQL query
+            params: Query parameters
+            dtype_backend: Requested pandas dtype backend
+            
+        Returns:
+            Path of the cache file, or None if the database file cannot be stat'ed
+        """
+        import hashlib
+        
+        db_path = Path(self.db.db_path)
+        try:
+            db_stat = db_path.stat()
+        except OSError:
+            return None
+        
+        wal_path = db_path.with_name(db_path.name + "-wal")
+        wal_state = ()
+        if wal_path.exists():
+            wal_stat = wal_path.stat()
+            # An empty WAL holds no data; it comes and goes as connections open and close
+            if wal_stat.st_size:
+                wal_state = (wal_stat.st_mtime_ns, wal_stat.st_size)
+        
+        query_key = hashlib.blake2b(repr((query, params, dtype_backend)).encode(), digest_size=8).hexdigest()
+        state_key = hashlib.blake2b(repr((db_stat.st_mtime_ns, db_stat.st_size, wal_state)).encode(),
+                                    digest_size=8).hexdigest()
+        return ATTENDANCE_CACHE_DIR / f"attendance_{query_key}_{state_key}.parquet"
+
+    def _write_cache(self, df, cache_path):
+        """
+        Persist a loaded DataFrame to the Parquet cache, replacing stale entries for the same query.
+        
+        Args:
+            df: DataFrame returned by load_attendance
+            cache_path: Path from _cache_path
+        """
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            query_key = cache_path.stem.split("_")[1]
+            for stale in cache_path.parent.glob(f"attendance_{query_key}_*.parquet"):
+                stale.unlink(missing_ok=True)
+            # Write then rename so a concurrent reader never sees a partial file
+            tmp_path = cache_path.with_suffix(".tmp")
+            df.to_parquet(tmp_path, compression="zstd")
+            tmp_path.replace(cache_path)
+        except Exception as e:
+            self.logger.warning(f"Could not write attendance cache {cache_path.name}: {e}")
+
+    def load_attendance(self, start_date=None, end_date=None, user_id=None, dtype_backend=None, columns=None,
+                        face_verified=None, use_cache=False):
         """
         Load attendance records from database with optional filters.
         
@@ -22,84 +164,105 @@ class AttendanceMetrics:
             start_date: Optional start date filter (datetime or date)
             end_date: Optional end date filter (datetime or date)
             user_id: Optional user ID filter
+            dtype_backend: Optional pandas dtype backend (e.g. 'pyarrow') - columns are then
+                           Arrow-backed so filters and reductions run on Arrow compute kernels
+            columns: Optional list of columns to load (keys of ATTENDANCE_COLUMNS) - only
+                     these are read from SQLite; the users join is skipped when not needed
+            face_verified: Optional ground-truth filter (1=genuine, 0=impostor) applied in SQL
+            use_cache: Reuse a Parquet copy of the result from an earlier run while the
+                       database is unchanged (stored under data/exports/.cache)
             
         Returns:
             DataFrame with attendance records
         """
-        query = """
-            SELECT 
-                a.id,
-                a.user_id,
-                u.name,
-                u.role,
-                a.recognition_score,
-                a.face_verified,
-                a.liveness_verified,
-                a.threshold_used,
-                a.system_decision,
-                a.timestamp
-            FROM attendance a
-            LEFT JOIN users u ON a.user_id = u.user_id
-            WHERE 1=1
-        """
-        params = []
+        projected = columns is not None
+        if not projected:
+            columns = list(ATTENDANCE_COLUMNS)
         
-        if start_date:
-            query += " AND DATE(a.timestamp) >= DATE(?)"
-            params.append(start_date if isinstance(start_date, str) else start_date.strftime('%Y-%m-%d'))
+        unknown = [col for col in columns if col not in ATTENDANCE_COLUMNS]
+        if unknown:
+            raise ValueError(f"Unknown attendance columns: {unknown}")
         
-        if end_date:
-            query += " AND DATE(a.timestamp) <= DATE(?)"
-            params.append(end_date if isinstance(end_date, str) else end_date.strftime('%Y-%m-%d'))
+        select_list = ", ".join(ATTENDANCE_COLUMNS[col] for col in columns)
+        query = f"SELECT {select_list} FROM attendance a"
+        # The users join is only needed for name/role
+        if any(ATTENDANCE_COLUMNS[col].startswith('u.') for col in columns):
+            query += " LEFT JOIN users u ON a.user_id = u.user_id"
+        query += " WHERE 1=1"
+        filter_sql, params = self._attendance_filters(start_date, end_date, user_id)
+        query += filter_sql
         
-        if user_id:
-            query += " AND a.user_id = ?"
-            params.append(user_id)
+        if face_verified is not None:
+            query += " AND a.face_verified = ?"
+            params.append(face_verified)
         
         query += " ORDER BY a.timestamp DESC"
         
+        cache_path = self._cache_path(query, params, dtype_backend) if use_cache else None
+        if cache_path is not None and cache_path.exists():
+            try:
+                read_kwargs = {'dtype_backend': dtype_backend} if dtype_backend else {}
+                df = pd.read_parquet(cache_path, **read_kwargs)
+                # Timestamps are always parsed to numpy datetimes, whatever the backend
+                if 'timestamp' in df.columns and isinstance(df['timestamp'].dtype, pd.ArrowDtype):
+                    df['timestamp'] = df['timestamp'].astype(df['timestamp'].dtype.numpy_dtype)
+                self.logger.info(f"Loaded {len(df)} attendance records from cache")
+                return df
+            except Exception as e:
+                self.logger.warning(f"Ignoring unreadable attendance cache {cache_path.name}: {e}")
+        
         try:
             with self.db.get_connection() as conn:
-                cursor = conn.cursor()
-                # Execute query with params (empty tuple if no params)
-                if params:
-                    cursor.execute(query, tuple(params))
+                if dtype_backend or projected:
+                    read_kwargs = {'dtype_backend': dtype_backend} if dtype_backend else {}
+                    df = pd.read_sql_query(query, conn, params=tuple(params), **read_kwargs)
+                    
+                    if df.empty:
+                        self.logger.info("No attendance records found in database")
+                        return pd.DataFrame()
                 else:
-                    cursor.execute(query)
-                
-                rows = cursor.fetchall()
+                    cursor = conn.cursor()
+                    # Plain tuples for this cursor - pandas builds the columns directly from them
+                    cursor.row_factory = None
+                    # Execute query with params (empty tuple if no params)
+                    if params:
+                        cursor.execute(query, tuple(params))
+                    else:
+                        cursor.execute(query)
+                    
+                    rows = cursor.fetchall()
+                    
+                    if not rows:
+                        self.logger.info("No attendance records found in database")
+                        return pd.DataFrame()
+                    
+                    df = pd.DataFrame.from_records(rows, columns=[desc[0] for desc in cursor.description])
                 
-                if not rows:
-                    self.logger.info("No attendance records found in database")
-                    return pd.DataFrame()
-                
-                # Convert sqlite3.Row objects to dicts
-                # sqlite3.Row objects support dict() conversion
-                data = []
-                for row in rows:
-                    try:
-                        if hasattr(row, 'keys'):
-                            # sqlite3.Row object - convert to dict
-                            data.append(dict(row))
-                        else:
-                            # Fallback for tuple rows
-                            columns = [desc[0] for desc in cursor.description]
-                            data.append(dict(zip(columns, row)))
-                    except Exception as row_error:
-                        self.logger.error(f"Error converting row to dict: {row_error}")
-                        self.logger.error(f"Row type: {type(row)}, Row value: {row}")
-                        continue
-                
-                if not data:
-                    self.logger.warning("No rows could be converted to dicts")
-                    return pd.DataFrame()
+                # Parse timestamps once here so downstream .dt accessors never re-parse
+                # ISO8601 covers stored values with and without microseconds
+                if 'timestamp' in df.columns:
+                    df['timestamp'] = pd.to_datetime(df['timestamp'], format='ISO8601', errors='coerce', cache=True)
                 
-                df = pd.DataFrame(data)
+                # Compact dtypes for the columns every evaluation pass scans; scores are 3-decimal
+                # values in [0, 1], flags are 0/1 and only narrowed when no NULLs need NaN
+                if dtype_backend == 'pyarrow':
+                    # Arrow integers are nullable, so the flags can always be narrowed; signed so
+                    # callers can still fill a NULL flag with -1
+                    compact = {'recognition_score': 'float32[pyarrow]'}
+                    compact.update({col: 'int8[pyarrow]' for col in ('face_verified', 'liveness_verified') if col in df.columns})
+                else:
+                    compact = {'recognition_score': 'float32'}
+                    for col in ('face_verified', 'liveness_verified'):
+                        if col in df.columns and df[col].notna().all():
+                            compact[col] = 'uint8'
+                    # A handful of distinct labels repeated on every row - store them as small integer codes
+                    compact.update({col: 'category' for col in ('role', 'system_decision')})
+                compact = {col: dtype for col, dtype in compact.items() if col in df.columns}
+                if compact:
+                    df = df.astype(compact)
                 
-                # Convert timestamp to datetime
-                # Handle mixed formats (with/without microseconds)
-                if 'timestamp' in df.columns:
-                    df['timestamp'] = pd.to_datetime(df['timestamp'], format='mixed', errors='coerce')
+                if cache_path is not None:
+                    self._write_cache(df, cache_path)
                 
                 self.logger.info(f"Loaded {len(df)} attendance records")
                 return df
@@ -109,6 +272,106 @@ class AttendanceMetrics:
             self.logger.error(traceback.format_exc())
             return pd.DataFrame()
 
+    def score_statistics_sql(self, start_date=None, end_date=None, user_id=None):
+        """
+        Compute genuine/impostor score statistics in SQLite without loading rows.
+        
+        For callers that have not loaded the attendance frame; with a frame in memory
+        use AttendanceEvaluation.get_score_statistics, which returns the same keys.
+        Count, mean, min, max and sum of squares come from one aggregate scan (the
+        sample standard deviation is rebuilt from those moments); median and quartiles
+        use the same linear interpolation as pandas, fetching only the ranked scores
+        they need.
+        
+        Args:
+            start_date: Optional start date filter (datetime or date)
+            end_date: Optional end date filter (datetime or date)
+            user_id: Optional user ID filter
+            
+        Returns:
+            Dictionary with 'genuine' and 'impostor' statistics (empty dict when no scores)
+        """
+        where = """
+            FROM attendance a
+            WHERE a.recognition_score IS NOT NULL
+              AND a.face_verified IN (0, 1)
+        """
+        filter_sql, params = self._attendance_filters(start_date, end_date, user_id)
+        where += filter_sql
+        
+        moments_query = f"""
+            SELECT 
+                a.face_verified,
+                COUNT(a.recognition_score) AS n,
+                AVG(a.recognition_score) AS mean,
+                MIN(a.recognition_score) AS min,
+                MAX(a.recognition_score) AS max,
+                SUM(a.recognition_score * a.recognition_score) AS sum_sq
+            {where}
+            GROUP BY a.face_verified
+        """
+        ranked_query = f"""
+            SELECT face_verified, rn, recognition_score FROM (
+                SELECT 
+                    a.face_verified,
+                    a.recognition_score,
+                    ROW_NUMBER() OVER (PARTITION BY a.face_verified ORDER BY a.recognition_score) - 1 AS rn
+                {where}
+            )
+            WHERE rn IN ({{}})
+        """
+        
+        result = {"genuine": {}, "impostor": {}}
+        
+        try:
+            rows = self.db.execute_query(moments_query, tuple(params))
+            
+            # Fractional 0-based rank of each quantile per group (pandas' 'linear' method)
+            positions = {row['face_verified']: {q: q * (row['n'] - 1) for q in QUANTILES} for row in rows}
+            ranks = sorted({
+                rank
+                for group in positions.values() for pos in group.values()
+                for rank in (math.floor(pos), math.ceil(pos))
+            })
+            ranked = {}
+            if ranks:
+                query = ranked_query.format(', '.join('?' * len(ranks)))
+                for r in self.db.execute_query(query, tuple(params) + tuple(ranks)):
+                    ranked[(r['face_verified'], r['rn'])] = r['recognition_score']
+        except Exception as e:
+            self.logger.error(f"Error computing score statistics: {e}")
+            return result
+        
+        for row in rows:
+            n = row['n']
+            mean = row['mean']
+            if n > 1:
+                # Sample variance from raw moments; clamp tiny negatives from rounding
+                variance = max((row['sum_sq'] - n * mean * mean) / (n - 1), 0.0)
+                std = round(math.sqrt(variance), 4)
+            else:
+                std = float('nan')  # pandas' sample std of one value, as in get_score_statistics
+            
+            quantiles = {}
+            for q, pos in positions[row['face_verified']].items():
+                low = ranked[(row['face_verified'], math.floor(pos))]
+                high = ranked[(row['face_verified'], math.ceil(pos))]
+                quantiles[q] = round(low + (high - low) * (pos - math.floor(pos)), 4)
+            
+            key = "genuine" if row['face_verified'] == 1 else "impostor"
+            result[key] = {
+                "count": n,
+                "mean": round(mean, 4),
+                "median": quantiles[0.5],
+                "std": std,
+                "min": round(row['min'], 4),
+                "max": round(row['max'], 4),
+                "q25": quantiles[0.25],
+                "q75": quantiles[0.75]
+            }
+        
+        return result
+
     def daily_summary(self, start_date=None, end_date=None):
         """
         Get daily attendance summary.
@@ -125,7 +388,7 @@ class AttendanceMetrics:
         if df.empty:
             return pd.DataFrame(columns=['date', 'count'])
         
-        df['date'] = pd.to_datetime(df['timestamp']).dt.date
+        df['date'] = df['timestamp'].dt.date
         daily = df.groupby('date').size().reset_index(name='count')
         daily = daily.sort_values('date')
         
@@ -147,8 +410,8 @@ class AttendanceMetrics:
         if df.empty:
             return pd.DataFrame(columns=['week', 'count'])
         
-        df['date'] = pd.to_datetime(df['timestamp']).dt.date
-        df['week'] = pd.to_datetime(df['timestamp']).dt.to_period('W').astype(str)
+        df['date'] = df['timestamp'].dt.date
+        df['week'] = df['timestamp'].dt.to_period('W').astype(str)
         weekly = df.groupby('week').size().reset_index(name='count')
         weekly = weekly.sort_values('week')
         
@@ -170,7 +433,7 @@ class AttendanceMetrics:
         if df.empty:
             return pd.DataFrame(columns=['user_id', 'name', 'role', 'attendance_count'])
         
-        user_summary = df.groupby(['user_id', 'name', 'role']).size().reset_index(name='attendance_count')
+        user_summary = df.groupby(['user_id', 'name', 'role'], observed=True).size().reset_index(name='attendance_count')
         user_summary = user_summary.sort_values('attendance_count', ascending=False)
         
         return user_summary
@@ -230,7 +493,7 @@ class AttendanceMetrics:
         if df.empty:
             return pd.DataFrame(columns=['hour', 'count'])
         
-        df['hour'] = pd.to_datetime(df['timestamp']).dt.hour
+        df['hour'] = df['timestamp'].dt.hour
         hourly = df.groupby('hour').size().reset_index(name='count')
         hourly = hourly.sort_values('hour')
         
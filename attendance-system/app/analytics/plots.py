@@ -1,14 +1,103 @@
+import hashlib
+from functools import lru_cache
 import pandas as pd
 import numpy as np
 import matplotlib
 matplotlib.use('Agg')  # Non-interactive backend for server environments
-import matplotlib.pyplot as plt
-import plotly.graph_objects as go
-import plotly.express as px
+from matplotlib.figure import Figure
 from pathlib import Path
 from app.utils.logging import setup_logger
 
 
+def _score_bin_edges(scores, bins: int):
+    """
+    Compute histogram bin edges for similarity scores.
+    
+    Edges span [0, 1], widened if any score falls outside that range
+    (cosine similarity can be negative for impostors).
+    """
+    lo = min(0.0, float(np.min(scores)))
+    hi = max(1.0, float(np.max(scores)))
+    return np.histogram_bin_edges(scores, bins=bins, range=(lo, hi))
+
+
+# Recently binned score arrays, keyed by content hash so _binned_scores can be memoised
+_SCORE_STORE_SIZE = 8
+_score_store = {}
+
+
+def _score_key(scores) -> str:
+    """
+    Register a score array in the store and return its content hash.
+    """
+    scores = np.ascontiguousarray(scores, dtype=np.float64)
+    key = hashlib.blake2b(scores.tobytes(), digest_size=8).hexdigest()
+    
+    # Re-insert so the current array is newest, then evict the oldest entries
+    _score_store.pop(key, None)
+    _score_store[key] = scores
+    while len(_score_store) > _SCORE_STORE_SIZE:
+        _score_store.pop(next(iter(_score_store)))
+    
+    return key
+
+
+@lru_cache(maxsize=_SCORE_STORE_SIZE)
+def _binned_scores(score_key: str, bins: int):
+    """
+    Histogram a registered score array (cached per array content and bin count).
+    
+    Returns:
+        Tuple of (counts, edges)
+    """
+    scores = _score_store[score_key]
+    return np.histogram(scores, bins=_score_bin_edges(scores, bins))
+
+
+def _lttb_indices(x, y, n_out: int):
+    """
+    Select visually representative points with Largest-Triangle-Three-Buckets.
+    
+    Args:
+        x: Monotonic x values
+        y: y values
+        n_out: Number of points to keep (first and last are always kept)
+        
+    Returns:
+        Array of indices into x/y
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    bucket_size = (n - 2) / (n_out - 2)
+    
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = n - 1
+    
+    a = 0
+    for i in range(n_out - 2):
+        start = int(i * bucket_size) + 1
+        end = int((i + 1) * bucket_size) + 1
+        next_end = min(int((i + 2) * bucket_size) + 1, n)
+        
+        # Average of the next bucket is the third triangle vertex
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        
+        area = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a]) -
+            (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(np.argmax(area))
+        indices[i + 1] = a
+    
+    return indices
+
+
 class EvaluationPlots:
     """
     Generates evaluation visualizations for biometric performance analysis.
@@ -38,29 +127,35 @@ class EvaluationPlots:
         if len(scores) == 0:
             return None
         
+        # Binned once per dataset; both backends and repeated exports reuse the result
+        counts, edges = _binned_scores(_score_key(scores.to_numpy()), bins)
+        
         if backend == 'plotly':
-            fig = px.histogram(
-                df,
-                x='recognition_score',
-                nbins=bins,
-                title='Recognition Score Distribution',
-                labels={'recognition_score': 'Similarity Score', 'count': 'Frequency'},
-                marginal="box"
-            )
+            import plotly.graph_objects as go
+            # Bin server-side so the figure carries one bar per bin instead of every raw score
+            fig = go.Figure(go.Bar(
+                x=(edges[:-1] + edges[1:]) / 2,
+                y=counts,
+                width=np.diff(edges),
+                name='Frequency'
+            ))
             fig.update_layout(
+                title='Recognition Score Distribution',
                 xaxis_title="Similarity Score",
                 yaxis_title="Frequency",
                 hovermode='x unified'
             )
             return fig
         else:  # matplotlib
-            fig, ax = plt.subplots(figsize=(10, 6))
-            ax.hist(scores, bins=bins, edgecolor='black', alpha=0.7)
+            # Figure is built without pyplot so plots can be rendered from worker threads
+            fig = Figure(figsize=(10, 6))
+            ax = fig.subplots()
+            ax.hist(edges[:-1], bins=edges, weights=counts, edgecolor='black', alpha=0.7)
             ax.set_xlabel('Similarity Score')
             ax.set_ylabel('Frequency')
             ax.set_title('Recognition Score Distribution')
             ax.grid(True, alpha=0.3)
-            plt.tight_layout()
+            fig.tight_layout()
             return fig
 
     def genuine_vs_impostor_distribution(self, df: pd.DataFrame, bins: int = 30, backend: str = 'plotly'):
@@ -85,23 +180,32 @@ class EvaluationPlots:
             return None
         
         if backend == 'plotly':
+            import plotly.graph_objects as go
+            # Shared bin edges so the overlaid bars line up
+            edges = _score_bin_edges(np.concatenate([genuine.to_numpy(), impostor.to_numpy()]), bins)
+            centers = (edges[:-1] + edges[1:]) / 2
+            widths = np.diff(edges)
             fig = go.Figure()
             
             if len(genuine) > 0:
-                fig.add_trace(go.Histogram(
-                    x=genuine,
+                counts, _ = np.histogram(genuine.to_numpy(), bins=edges)
+                fig.add_trace(go.Bar(
+                    x=centers,
+                    y=counts,
+                    width=widths,
                     name='Genuine',
-                    opacity=0.7,
-                    nbinsx=bins,
+                    opacity=0.6,
                     marker_color='green'
                 ))
             
             if len(impostor) > 0:
-                fig.add_trace(go.Histogram(
-                    x=impostor,
+                counts, _ = np.histogram(impostor.to_numpy(), bins=edges)
+                fig.add_trace(go.Bar(
+                    x=centers,
+                    y=counts,
+                    width=widths,
                     name='Impostor',
-                    opacity=0.7,
-                    nbinsx=bins,
+                    opacity=0.6,
                     marker_color='red'
                 ))
             
@@ -114,7 +218,8 @@ class EvaluationPlots:
             )
             return fig
         else:  # matplotlib
-            fig, ax = plt.subplots(figsize=(10, 6))
+            fig = Figure(figsize=(10, 6))
+            ax = fig.subplots()
             
             if len(genuine) > 0:
                 ax.hist(genuine, bins=bins, alpha=0.7, label='Genuine', color='green', edgecolor='black')
@@ -127,10 +232,11 @@ class EvaluationPlots:
             ax.set_title('Genuine vs Impostor Score Distribution')
             ax.legend()
             ax.grid(True, alpha=0.3)
-            plt.tight_layout()
+            fig.tight_layout()
             return fig
 
-    def far_frr_curve(self, df: pd.DataFrame, num_thresholds: int = 50, backend: str = 'plotly'):
+    def far_frr_curve(self, df: pd.DataFrame, num_thresholds: int = 50, backend: str = 'plotly',
+                      downsample: bool = True, max_points: int = 500, precomputed: pd.DataFrame = None):
         """
         Create FAR/FRR curve across threshold range.
         
@@ -138,6 +244,9 @@ class EvaluationPlots:
             df: DataFrame with attendance records
             num_thresholds: Number of threshold points
             backend: 'plotly' or 'matplotlib'
+            downsample: Reduce each curve to at most max_points using LTTB
+            max_points: Maximum points per curve when downsampling
+            precomputed: Optional result of compute_metrics_sweep to plot instead of sweeping again
             
         Returns:
             Plotly figure or matplotlib figure
@@ -145,32 +254,42 @@ class EvaluationPlots:
         from app.analytics.evaluation import AttendanceEvaluation
         
         evaluator = AttendanceEvaluation()
-        sweep_df = evaluator.compute_metrics_sweep(df, num_thresholds)
+        sweep_df = precomputed if precomputed is not None else evaluator.compute_metrics_sweep(df, num_thresholds)
         
         if sweep_df.empty:
             return None
         
+        thresholds = sweep_df['threshold'].to_numpy()
+        far = sweep_df['FAR'].to_numpy()
+        frr = sweep_df['FRR'].to_numpy()
+        if downsample:
+            far_idx = _lttb_indices(thresholds, far, max_points)
+            frr_idx = _lttb_indices(thresholds, frr, max_points)
+        else:
+            far_idx = frr_idx = np.arange(len(thresholds))
+        
         if backend == 'plotly':
+            import plotly.graph_objects as go
             fig = go.Figure()
             
             fig.add_trace(go.Scatter(
-                x=sweep_df['threshold'],
-                y=sweep_df['FAR'],
+                x=thresholds[far_idx],
+                y=far[far_idx],
                 mode='lines',
                 name='FAR (False Acceptance Rate)',
                 line=dict(color='red', width=2)
             ))
             
             fig.add_trace(go.Scatter(
-                x=sweep_df['threshold'],
-                y=sweep_df['FRR'],
+                x=thresholds[frr_idx],
+                y=frr[frr_idx],
                 mode='lines',
                 name='FRR (False Rejection Rate)',
                 line=dict(color='blue', width=2)
             ))
             
             # Add EER point
-            eer_result = evaluator.find_eer_threshold(df)
+            eer_result = evaluator.find_eer_threshold(df, precomputed=precomputed)
             if eer_result['eer_value'] > 0:
                 fig.add_trace(go.Scatter(
                     x=[eer_result['eer_threshold']],
@@ -189,15 +308,16 @@ class EvaluationPlots:
             )
             return fig
         else:  # matplotlib
-            fig, ax = plt.subplots(figsize=(10, 6))
+            fig = Figure(figsize=(10, 6))
+            ax = fig.subplots()
             
-            ax.plot(sweep_df['threshold'], sweep_df['FAR'], label='FAR (False Acceptance Rate)', 
+            ax.plot(thresholds[far_idx], far[far_idx], label='FAR (False Acceptance Rate)', 
                    color='red', linewidth=2)
-            ax.plot(sweep_df['threshold'], sweep_df['FRR'], label='FRR (False Rejection Rate)', 
+            ax.plot(thresholds[frr_idx], frr[frr_idx], label='FRR (False Rejection Rate)', 
                    color='blue', linewidth=2)
             
             # Add EER point
-            eer_result = evaluator.find_eer_threshold(df)
+            eer_result = evaluator.find_eer_threshold(df, precomputed=precomputed)
             if eer_result['eer_value'] > 0:
                 ax.plot(eer_result['eer_threshold'], eer_result['eer_value'], 
                        'k*', markersize=15, label=f"EER (Threshold: {eer_result['eer_threshold']:.3f})")
@@ -208,10 +328,11 @@ class EvaluationPlots:
             ax.legend()
             ax.grid(True, alpha=0.3)
             ax.set_ylim([0, 1])
-            plt.tight_layout()
+            fig.tight_layout()
             return fig
 
-    def accuracy_curve(self, df: pd.DataFrame, num_thresholds: int = 50, backend: str = 'plotly'):
+    def accuracy_curve(self, df: pd.DataFrame, num_thresholds: int = 50, backend: str = 'plotly',
+                       downsample: bool = True, max_points: int = 500, precomputed: pd.DataFrame = None):
         """
         Create accuracy curve across threshold range.
         
@@ -219,6 +340,9 @@ class EvaluationPlots:
             df: DataFrame with attendance records
             num_thresholds: Number of threshold points
             backend: 'plotly' or 'matplotlib'
+            downsample: Reduce the curve to at most max_points using LTTB
+            max_points: Maximum points when downsampling
+            precomputed: Optional result of compute_metrics_sweep to plot instead of sweeping again
             
         Returns:
             Plotly figure or matplotlib figure
@@ -226,12 +350,17 @@ class EvaluationPlots:
         from app.analytics.evaluation import AttendanceEvaluation
         
         evaluator = AttendanceEvaluation()
-        sweep_df = evaluator.compute_metrics_sweep(df, num_thresholds)
+        sweep_df = precomputed if precomputed is not None else evaluator.compute_metrics_sweep(df, num_thresholds)
         
         if sweep_df.empty:
             return None
         
+        if downsample:
+            keep = _lttb_indices(sweep_df['threshold'].to_numpy(), sweep_df['accuracy'].to_numpy(), max_points)
+            sweep_df = sweep_df.iloc[keep]
+        
         if backend == 'plotly':
+            import plotly.express as px
             fig = px.line(
                 sweep_df,
                 x='threshold',
@@ -248,17 +377,18 @@ class EvaluationPlots:
             )
             return fig
         else:  # matplotlib
-            fig, ax = plt.subplots(figsize=(10, 6))
+            fig = Figure(figsize=(10, 6))
+            ax = fig.subplots()
             ax.plot(sweep_df['threshold'], sweep_df['accuracy'], linewidth=2, color='green')
             ax.set_xlabel('Threshold')
             ax.set_ylabel('Accuracy')
             ax.set_title('Accuracy vs Threshold')
             ax.grid(True, alpha=0.3)
             ax.set_ylim([0, 1])
-            plt.tight_layout()
+            fig.tight_layout()
             return fig
 
-    def save_matplotlib_figure(self, fig, filepath: Path, dpi: int = 300):
+    def save_matplotlib_figure(self, fig, filepath: Path, dpi: int = 300, compress_level: int = None):
         """
         Save matplotlib figure to file.
         
@@ -266,6 +396,8 @@ class EvaluationPlots:
             fig: Matplotlib figure
             filepath: Path to save file
             dpi: Resolution (default: 300)
+            compress_level: PNG zlib level 0-9 (default: Pillow's default of 6);
+                            low levels encode much faster for slightly larger files
         """
         if fig is None:
             self.logger.warning(f"Cannot save figure: figure is None")
@@ -273,7 +405,10 @@ class EvaluationPlots:
         
         try:
             filepath.parent.mkdir(parents=True, exist_ok=True)
-            fig.savefig(filepath, dpi=dpi, bbox_inches='tight')
+            save_kwargs = {}
+            if compress_level is not None and filepath.suffix.lower() == '.png':
+                save_kwargs['pil_kwargs'] = {'compress_level': compress_level}
+            fig.savefig(filepath, dpi=dpi, bbox_inches='tight', **save_kwargs)
             self.logger.info(f"Saved figure to {filepath}")
         except Exception as e:
             self.logger.error(f"Failed to save figure to {filepath}: {e}")
@@ -1,5 +1,6 @@
 import pandas as pd
 from datetime import datetime, timedelta
+from app.analytics.metrics import timestamp_range_filter
 from app.database.db_manager import DatabaseManager
 from app.utils.logging import setup_logger
 
@@ -39,43 +40,27 @@ class StudentMetrics:
         """
         params = [user_id]
         
-        if start_date:
-            query += " AND DATE(a.timestamp) >= DATE(?)"
-            params.append(start_date if isinstance(start_date, str) else start_date.strftime('%Y-%m-%d'))
-        
-        if end_date:
-            query += " AND DATE(a.timestamp) <= DATE(?)"
-            params.append(end_date if isinstance(end_date, str) else end_date.strftime('%Y-%m-%d'))
+        range_sql, range_params = timestamp_range_filter(start_date, end_date)
+        query += range_sql
+        params.extend(range_params)
         
         query += " ORDER BY a.timestamp DESC"
         
         try:
             with self.db.get_connection() as conn:
                 cursor = conn.cursor()
+                # Plain tuples for this cursor - pandas builds the columns directly from them
+                cursor.row_factory = None
                 cursor.execute(query, tuple(params))
                 rows = cursor.fetchall()
                 
                 if not rows:
                     return pd.DataFrame()
                 
-                data = []
-                for row in rows:
-                    if hasattr(row, 'keys'):
-                        data.append(dict(row))
-                    else:
-                        data.append({
-                            'id': row[0] if len(row) > 0 else None,
-                            'user_id': row[1] if len(row) > 1 else None,
-                            'recognition_score': row[2] if len(row) > 2 else None,
-                            'face_verified': row[3] if len(row) > 3 else None,
-                            'liveness_verified': row[4] if len(row) > 4 else None,
-                            'timestamp': row[5] if len(row) > 5 else None,
-                        })
-                
-                df = pd.DataFrame(data)
+                df = pd.DataFrame.from_records(rows, columns=[desc[0] for desc in cursor.description])
                 
                 if 'timestamp' in df.columns:
-                    df['timestamp'] = pd.to_datetime(df['timestamp'])
+                    df['timestamp'] = pd.to_datetime(df['timestamp'], format='ISO8601', cache=True)
                     df['date'] = df['timestamp'].dt.date
                 
                 return df
@@ -96,7 +81,20 @@ class StudentMetrics:
             Dictionary with student statistics
         """
         df = self.get_student_attendance_history(user_id, start_date, end_date)
+        return self._statistics_from_history(df, start_date, end_date)
+
+    def _statistics_from_history(self, df: pd.DataFrame, start_date=None, end_date=None):
+        """
+        Derive student statistics from an already-loaded attendance history.
         
+        Args:
+            df: DataFrame from get_student_attendance_history
+            start_date: Start date the history was filtered by (or None)
+            end_date: End date the history was filtered by (or None)
+            
+        Returns:
+            Dictionary with student statistics
+        """
         if df.empty:
             return {
                 "total_attendance": 0,
@@ -166,12 +164,23 @@ class StudentMetrics:
             DataFrame with date and average score per day
         """
         df = self.get_student_attendance_history(user_id, start_date, end_date)
+        return self._score_trends_from_history(df)
+
+    def _score_trends_from_history(self, df: pd.DataFrame):
+        """
+        Derive daily average score trends from an already-loaded attendance history.
         
+        Args:
+            df: DataFrame from get_student_attendance_history
+            
+        Returns:
+            DataFrame with date and average score per day
+        """
         if df.empty or 'recognition_score' not in df.columns:
             return pd.DataFrame(columns=['date', 'avg_score', 'count'])
         
         if 'date' not in df.columns:
-            df['date'] = pd.to_datetime(df['timestamp']).dt.date
+            df = df.assign(date=pd.to_datetime(df['timestamp']).dt.date)
         
         # Group by date and calculate average score
         daily_scores = df.groupby('date').agg({
@@ -188,26 +197,46 @@ class StudentMetrics:
         """
         Get student's most recent attendance records.
         
+        Only the columns needed for display are selected, and the limit is
+        applied in SQL.
+        
         Args:
             user_id: Student user ID
             limit: Number of recent records to return
             
         Returns:
-            DataFrame with recent attendance records
+            DataFrame with timestamp, recognition_score, face_verified and
+            liveness_verified columns
+        """
+        query = """
+            SELECT 
+                timestamp,
+                recognition_score,
+                face_verified,
+                liveness_verified
+            FROM attendance
+            WHERE user_id = ?
+            ORDER BY timestamp DESC
+            LIMIT ?
         """
-        df = self.get_student_attendance_history(user_id)
         
-        if df.empty:
+        try:
+            with self.db.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(query, (user_id, limit))
+                rows = cursor.fetchall()
+                
+                if not rows:
+                    return pd.DataFrame()
+                
+                columns = [desc[0] for desc in cursor.description]
+                df = pd.DataFrame.from_records(rows, columns=columns)
+                df['timestamp'] = pd.to_datetime(df['timestamp'], format='ISO8601', cache=True)
+                
+                return df
+        except Exception as e:
+            self.logger.error(f"Error loading recent student records: {e}")
             return pd.DataFrame()
-        
-        # Return most recent records
-        recent = df.head(limit).copy()
-        
-        # Format for display
-        if 'timestamp' in recent.columns:
-            recent['formatted_time'] = pd.to_datetime(recent['timestamp']).dt.strftime('%Y-%m-%d %H:%M:%S')
-        
-        return recent
 
     def get_student_daily_summary(self, user_id: str, start_date=None, end_date=None):
         """
@@ -222,15 +251,47 @@ class StudentMetrics:
             DataFrame with date and count columns
         """
         df = self.get_student_attendance_history(user_id, start_date, end_date)
+        return self._daily_from_history(df)
+
+    def _daily_from_history(self, df: pd.DataFrame):
+        """
+        Derive daily attendance counts from an already-loaded attendance history.
         
+        Args:
+            df: DataFrame from get_student_attendance_history
+            
+        Returns:
+            DataFrame with date and count columns
+        """
         if df.empty:
             return pd.DataFrame(columns=['date', 'count'])
         
         if 'date' not in df.columns:
-            df['date'] = pd.to_datetime(df['timestamp']).dt.date
+            df = df.assign(date=pd.to_datetime(df['timestamp']).dt.date)
         
         daily = df.groupby('date').size().reset_index(name='count')
         daily = daily.sort_values('date')
         
         return daily
 
+    def get_student_bundle(self, user_id: str, start_date=None, end_date=None):
+        """
+        Load a student's attendance history once and derive all profile metrics from it.
+        
+        Args:
+            user_id: Student user ID
+            start_date: Optional start date filter
+            end_date: Optional end date filter
+            
+        Returns:
+            Dictionary with history, statistics, daily and score_trends
+        """
+        df = self.get_student_attendance_history(user_id, start_date, end_date)
+        
+        return {
+            "history": df,
+            "statistics": self._statistics_from_history(df, start_date, end_date),
+            "daily": self._daily_from_history(df),
+            "score_trends": self._score_trends_from_history(df)
+        }
+
@@ -8,8 +8,21 @@ class IDValidator:
     Validates institutional ID using QR codes.
     """
 
-    def __init__(self):
+    def __init__(self, detector='pyzbar'):
+        """
+        Args:
+            detector: 'pyzbar' (default) or 'aruco' for OpenCV's QRCodeDetectorAruco
+                      (OpenCV 4.7+), which is faster on webcam frames
+        """
         self.logger = setup_logger()
+        self.aruco = None
+        
+        if detector == 'aruco':
+            if hasattr(cv2, 'QRCodeDetectorAruco'):
+                # Created once and reused for every frame
+                self.aruco = cv2.QRCodeDetectorAruco()
+            else:
+                self.logger.warning("cv2.QRCodeDetectorAruco requires OpenCV 4.7+, falling back to pyzbar")
 
     def scan(self, frame):
         """
@@ -19,6 +32,14 @@ class IDValidator:
         try:
             # Convert to grayscale for better QR detection
             gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+            
+            if self.aruco is not None:
+                qr_data, _, _ = self.aruco.detectAndDecode(gray)
+                if qr_data:
+                    self.logger.info(f"QR detected: {qr_data}")
+                    return qr_data
+                return None
+            
             decoded_objects = decode(gray)
             
             for obj in decoded_objects:
@@ -1,9 +1,23 @@
 import sqlite3
+import threading
 from pathlib import Path
 from contextlib import contextmanager
 from app.config.paths import DB_PATH
 from app.utils.logging import setup_logger
 
+# Per-thread connection cache shared by all DatabaseManager instances, keyed by db path
+_local = threading.local()
+
+# Applied once when a connection is opened; WAL lets concurrent readers proceed while one writer commits
+CONNECTION_PRAGMAS = """
+    PRAGMA journal_mode = WAL;
+    PRAGMA synchronous = NORMAL;
+    PRAGMA mmap_size = 268435456;
+    PRAGMA cache_size = -65536;
+    PRAGMA temp_store = MEMORY;
+    PRAGMA foreign_keys = ON;
+"""
+
 class DatabaseManager:
     """
     Manages SQLite database connections and operations.
@@ -11,19 +25,44 @@ class DatabaseManager:
     
     def __init__(self):
         self.db_path = DB_PATH
-        self.logger = setup_logger()
+        self._logger = None
+    
+    @property
+    def logger(self):
+        """
+        Logger for database errors, created on first use so that opening the log
+        file is skipped entirely when nothing needs to be logged.
+        """
+        if self._logger is None:
+            self._logger = setup_logger()
+        return self._logger
+    
+    def _connect(self):
+        """
+        Return this thread's connection to the database, opening it on first use.
+        """
+        connections = getattr(_local, 'connections', None)
+        if connections is None:
+            connections = _local.connections = {}
+        
+        key = str(self.db_path)
+        conn = connections.get(key)
+        if conn is None:
+            conn = sqlite3.connect(key)
+            conn.row_factory = sqlite3.Row  # Enable column access by name
+            conn.executescript(CONNECTION_PRAGMAS)
+            connections[key] = conn
+        return conn
     
     @contextmanager
     def get_connection(self):
         """
         Context manager for database connections.
-        Ensures proper connection handling and rollback on errors.
+        Reuses a per-thread connection and ensures rollback on errors.
         """
         conn = None
         try:
-            conn = sqlite3.connect(str(self.db_path))
-            conn.row_factory = sqlite3.Row  # Enable column access by name
-            conn.execute("PRAGMA foreign_keys = ON")  # Enable foreign keys
+            conn = self._connect()
             yield conn
             conn.commit()
         except sqlite3.Error as e:
@@ -31,9 +70,20 @@ class DatabaseManager:
                 conn.rollback()
             self.logger.error(f"Database error: {e}")
             raise
-        finally:
+        except BaseException:
+            # Never leave a half-finished transaction on the shared connection
             if conn:
-                conn.close()
+                conn.rollback()
+            raise
+    
+    def close_connection(self):
+        """
+        Close this thread's cached connection, if one is open.
+        """
+        connections = getattr(_local, 'connections', {})
+        conn = connections.pop(str(self.db_path), None)
+        if conn:
+            conn.close()
     
     def initialize_db(self):
         """
@@ -84,6 +134,81 @@ class DatabaseManager:
             conn.commit()
             return cursor.lastrowid
     
+    def bulk_insert(self, table, columns, rows, defer_indexes=False):
+        """
+        Insert many rows with one prepared statement in a single transaction.
+        
+        Args:
+            table: Target table name
+            columns: Sequence of column names, in the order of each row's values
+            rows: Sequence of parameter tuples
+            defer_indexes: Drop the table's non-unique indexes before inserting and
+                rebuild them afterwards when the batch is at least as large as the
+                existing table (one rebuild is cheaper than per-row maintenance)
+        
+        Returns:
+            Number of rows inserted
+        """
+        column_list = ", ".join(columns)
+        placeholders = ", ".join("?" * len(columns))
+        query = f"INSERT INTO {table} ({column_list}) VALUES ({placeholders})"
+        
+        with self.get_connection() as conn:
+            # sqlite3 does not open a transaction for DDL on its own - start one so
+            # dropped indexes are restored by the rollback if the insert fails
+            if not conn.in_transaction:
+                conn.execute("BEGIN")
+            index_sql = []
+            if defer_indexes:
+                existing_rows = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                if len(rows) >= existing_rows:
+                    index_sql = self._drop_secondary_indexes(conn, table)
+            
+            cursor = conn.cursor()
+            try:
+                cursor.executemany(query, rows)
+            finally:
+                for sql in index_sql:
+                    conn.execute(sql)
+            return cursor.rowcount
+    
+    def bulk_update(self, query, rows):
+        """
+        Run an UPDATE/DELETE statement once per parameter tuple in a single transaction.
+        
+        Args:
+            query: Parameterised UPDATE or DELETE statement
+            rows: Sequence of parameter tuples
+        
+        Returns:
+            Total number of rows modified
+        """
+        with self.get_connection() as conn:
+            if not conn.in_transaction:
+                conn.execute("BEGIN")
+            cursor = conn.cursor()
+            cursor.executemany(query, rows)
+            return cursor.rowcount
+    
+    def _drop_secondary_indexes(self, conn, table):
+        """
+        Drop the explicitly created, non-unique indexes on a table.
+        
+        Returns:
+            List of CREATE INDEX statements needed to restore them
+        """
+        unique_indexes = {row[1] for row in conn.execute(f"PRAGMA index_list('{table}')") if row[2]}
+        index_sql = []
+        # sql IS NULL for automatic indexes (PRIMARY KEY / UNIQUE constraints) - those stay
+        for name, sql in conn.execute(
+            "SELECT name, sql FROM sqlite_master WHERE type='index' AND tbl_name=? AND sql IS NOT NULL",
+            (table,)
+        ).fetchall():
+            if name not in unique_indexes:
+                index_sql.append(sql)
+                conn.execute(f'DROP INDEX "{name}"')
+        return index_sql
+    
     def table_exists(self, table_name):
         """
         Check if a table exists in the database.
@@ -37,4 +37,4 @@ CREATE TABLE IF NOT EXISTS attendance (
 CREATE INDEX IF NOT EXISTS idx_face_templates_user_id ON face_templates(user_id);
 CREATE INDEX IF NOT EXISTS idx_attendance_user_id ON attendance(user_id);
 CREATE INDEX IF NOT EXISTS idx_attendance_timestamp ON attendance(timestamp);
-
+CREATE INDEX IF NOT EXISTS idx_attendance_face_decision ON attendance(face_verified, system_decision);
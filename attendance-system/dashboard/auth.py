@@ -1,6 +1,5 @@
 import streamlit as st
 import sys
-import os
 from pathlib import Path
 
 # Get the attendance-system directory (parent of dashboard)
@@ -8,9 +7,6 @@ attendance_system_dir = str(Path(__file__).parent.parent)
 if attendance_system_dir not in sys.path:
     sys.path.insert(0, attendance_system_dir)
 
-# Change working directory to attendance-system for proper module resolution
-os.chdir(attendance_system_dir)
-
 # Lazy import functions to avoid circular dependency
 def _get_models():
     """Lazy import to avoid circular dependency."""
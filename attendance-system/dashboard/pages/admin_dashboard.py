@@ -1,7 +1,6 @@
 import streamlit as st
 import pandas as pd
 import sys
-import os
 from pathlib import Path
 
 # Get the attendance-system directory
@@ -9,9 +8,6 @@ attendance_system_dir = str(Path(__file__).parent.parent.parent)
 if attendance_system_dir not in sys.path:
     sys.path.insert(0, attendance_system_dir)
 
-# Change working directory to attendance-system for proper module resolution
-os.chdir(attendance_system_dir)
-
 from app.analytics.metrics import AttendanceMetrics
 from app.analytics.reports import ReportService
 from app.analytics.data_cleaning import DataCleaning
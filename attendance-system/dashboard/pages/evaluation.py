@@ -3,6 +3,7 @@ import pandas as pd
 import sys
 from pathlib import Path
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 # Add parent directory to path for imports
 parent_dir = str(Path(__file__).parent.parent.parent)
@@ -73,17 +74,12 @@ st.sidebar.header("🧹 Data Options")
 apply_cleaning = st.sidebar.checkbox("Apply Data Cleaning", value=True, 
                                      help="Remove duplicates, handle missing values, filter test users")
 
-# Load data
-with st.spinner("Loading attendance data..."):
-    df = metrics.load_attendance(start_date=start_date, end_date=end_date, user_id=user_id)
-
-if df.empty:
-    st.warning("⚠️ No attendance data available for the selected filters.")
-    st.stop()
-
-# Apply cleaning
-if apply_cleaning:
-    with st.spinner("Applying data cleaning (keeping all attempts for evaluation)..."):
+def _load_and_clean(start_date, end_date, user_id, apply_cleaning):
+    """Load attendance for the given filters and apply evaluation-safe cleaning."""
+    # Arrow-backed columns keep the cleaning filters and reductions in Arrow's C kernels
+    df = metrics.load_attendance(start_date=start_date, end_date=end_date, user_id=user_id, dtype_backend='pyarrow')
+    
+    if apply_cleaning and not df.empty:
         # Skip duplicate removal for evaluation - we need ALL attempts for accurate FAR/FRR
         df = cleaning.clean_attendance_data(
             df,
@@ -93,63 +89,92 @@ if apply_cleaning:
             flag_outliers=True,
             filter_test_users=True
         )
+    
+    return df
+
+if st.sidebar.button("🔄 Reload Data", help="Reload attendance records from the database"):
+    st.session_state.pop('evaluation_filter_key', None)
+
+# Load data only when the filters change - threshold/checkbox reruns reuse the loaded frame
+filter_key = (start_date, end_date, user_id, apply_cleaning)
+if st.session_state.get('evaluation_filter_key') != filter_key:
+    with st.spinner("Loading attendance data..."):
+        st.session_state['evaluation_df'] = _load_and_clean(*filter_key)
+    st.session_state['evaluation_filter_key'] = filter_key
+
+df = st.session_state['evaluation_df']
 
 if df.empty:
-    st.warning("⚠️ No data remaining after cleaning.")
+    st.warning("⚠️ No attendance data available for the selected filters.")
     st.stop()
 
 st.success(f"✅ Loaded {len(df)} attendance records")
 
-# Threshold selection
-st.sidebar.header("⚙️ Evaluation Settings")
-threshold = st.sidebar.slider(
-    "Similarity Score Threshold",
-    min_value=0.0,
-    max_value=1.0,
-    value=0.5,
-    step=0.01,
-    help="Threshold for determining acceptance/rejection"
-)
-
-# Compute metrics
-# Use stored system_decision for accurate evaluation (recommended)
-use_stored = st.sidebar.checkbox(
-    "Use Stored System Decision",
-    value=True,
-    help="Use stored system_decision and threshold_used for accurate evaluation. Recommended for correct FAR/FRR calculation."
-)
 with st.spinner("Computing evaluation metrics..."):
-    metrics_result = evaluator.compute_metrics(df, threshold, use_stored_decision=use_stored)
-    eer_result = evaluator.find_eer_threshold(df)
+    # One threshold sweep shared by the EER search, both curves and the PNG export
+    sweep_df = evaluator.compute_metrics_sweep(df, num_thresholds=100)
+    eer_result = evaluator.find_eer_threshold(df, precomputed=sweep_df)
+    # From the loaded frame, so the statistics always describe the same rows as the metrics
     stats = evaluator.get_score_statistics(df)
 
-# Display metrics
-st.subheader("📈 Key Performance Metrics")
-
-col1, col2, col3, col4 = st.columns(4)
-col1.metric("FAR", f"{metrics_result['FAR']:.4f}", f"{metrics_result['FAR']*100:.2f}%")
-col2.metric("FRR", f"{metrics_result['FRR']:.4f}", f"{metrics_result['FRR']*100:.2f}%")
-col3.metric("Accuracy", f"{metrics_result['accuracy']:.4f}", f"{metrics_result['accuracy']*100:.2f}%")
-col4.metric("EER", f"{eer_result['eer_value']:.4f}", f"@ {eer_result['eer_threshold']:.3f}")
-
-st.markdown("---")
-
-# Detailed metrics
-with st.expander("📋 Detailed Metrics", expanded=False):
-    col1, col2 = st.columns(2)
+@st.fragment
+def render_metrics(df, eer_result):
+    """Threshold controls and the metrics that depend on them; reruns on its own when they change."""
+    st.subheader("⚙️ Evaluation Settings")
     
-    with col1:
-        st.write("**Attempt Counts:**")
-        st.write(f"- Total Attempts: {metrics_result['total_attempts']}")
-        st.write(f"- Genuine Attempts: {metrics_result['genuine_attempts']}")
-        st.write(f"- Impostor Attempts: {metrics_result['impostor_attempts']}")
+    col1, col2 = st.columns([3, 1])
     
-    with col2:
-        st.write("**Classification Results:**")
-        st.write(f"- True Accepts: {metrics_result['true_accepts']}")
-        st.write(f"- True Rejects: {metrics_result['true_rejects']}")
-        st.write(f"- False Accepts: {metrics_result['false_accepts']}")
-        st.write(f"- False Rejects: {metrics_result['false_rejects']}")
+    # Threshold selection
+    threshold = col1.slider(
+        "Similarity Score Threshold",
+        min_value=0.0,
+        max_value=1.0,
+        value=0.5,
+        step=0.01,
+        help="Threshold for determining acceptance/rejection"
+    )
+    
+    # Use stored system_decision for accurate evaluation (recommended)
+    use_stored = col2.checkbox(
+        "Use Stored System Decision",
+        value=True,
+        help="Use stored system_decision and threshold_used for accurate evaluation. Recommended for correct FAR/FRR calculation."
+    )
+    
+    metrics_result = evaluator.compute_metrics(df, threshold, use_stored_decision=use_stored)
+    # Kept for the export fragment, which reruns independently
+    st.session_state['evaluation_metrics'] = metrics_result
+    
+    # Display metrics
+    st.subheader("📈 Key Performance Metrics")
+    
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("FAR", f"{metrics_result['FAR']:.4f}", f"{metrics_result['FAR']*100:.2f}%")
+    col2.metric("FRR", f"{metrics_result['FRR']:.4f}", f"{metrics_result['FRR']*100:.2f}%")
+    col3.metric("Accuracy", f"{metrics_result['accuracy']:.4f}", f"{metrics_result['accuracy']*100:.2f}%")
+    col4.metric("EER", f"{eer_result['eer_value']:.4f}", f"@ {eer_result['eer_threshold']:.3f}")
+    
+    st.markdown("---")
+    
+    # Detailed metrics
+    with st.expander("📋 Detailed Metrics", expanded=False):
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.write("**Attempt Counts:**")
+            st.write(f"- Total Attempts: {metrics_result['total_attempts']}")
+            st.write(f"- Genuine Attempts: {metrics_result['genuine_attempts']}")
+            st.write(f"- Impostor Attempts: {metrics_result['impostor_attempts']}")
+        
+        with col2:
+            st.write("**Classification Results:**")
+            st.write(f"- True Accepts: {metrics_result['true_accepts']}")
+            st.write(f"- True Rejects: {metrics_result['true_rejects']}")
+            st.write(f"- False Accepts: {metrics_result['false_accepts']}")
+            st.write(f"- False Rejects: {metrics_result['false_rejects']}")
+
+# Threshold changes rerun only this block - the plots below are not rebuilt
+render_metrics(df, eer_result)
 
 # Score statistics
 if stats['genuine'] or stats['impostor']:
@@ -195,7 +220,7 @@ col1, col2 = st.columns(2)
 
 with col1:
     st.write("**FAR / FRR vs Threshold**")
-    fig = plots.far_frr_curve(df, backend='plotly')
+    fig = plots.far_frr_curve(df, backend='plotly', precomputed=sweep_df)
     if fig:
         st.plotly_chart(fig, use_container_width=True)
     else:
@@ -203,7 +228,7 @@ with col1:
 
 with col2:
     st.write("**Accuracy vs Threshold**")
-    fig = plots.accuracy_curve(df, backend='plotly')
+    fig = plots.accuracy_curve(df, backend='plotly', precomputed=sweep_df)
     if fig:
         st.plotly_chart(fig, use_container_width=True)
     else:
@@ -212,77 +237,79 @@ with col2:
 st.markdown("---")
 
 # Export section
-st.subheader("💾 Export Results")
+@st.fragment
+def render_export(df, eer_result, sweep_df):
+    """Export buttons; a click reruns only this block instead of the whole page."""
+    st.subheader("💾 Export Results")
 
-col1, col2 = st.columns(2)
+    col1, col2 = st.columns(2)
 
-with col1:
-    if st.button("📥 Export Metrics (CSV)", use_container_width=True):
-        try:
-            from app.config.paths import EXPORTS_DIR
-            from app.analytics.reports import ReportService
-            
-            reports = ReportService()
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            
-            # Create metrics summary
-            summary_df = pd.DataFrame([{
-                'threshold': metrics_result['threshold'],
-                'FAR': metrics_result['FAR'],
-                'FRR': metrics_result['FRR'],
-                'accuracy': metrics_result['accuracy'],
-                'total_attempts': metrics_result['total_attempts'],
-                'genuine_attempts': metrics_result['genuine_attempts'],
-                'impostor_attempts': metrics_result['impostor_attempts'],
-                'true_accepts': metrics_result['true_accepts'],
-                'true_rejects': metrics_result['true_rejects'],
-                'false_accepts': metrics_result['false_accepts'],
-                'false_rejects': metrics_result['false_rejects'],
-                'eer_threshold': eer_result['eer_threshold'],
-                'eer_value': eer_result['eer_value']
-            }])
-            
-            filepath = EXPORTS_DIR / f"evaluation_metrics_{timestamp}.csv"
-            filepath.parent.mkdir(parents=True, exist_ok=True)
-            summary_df.to_csv(filepath, index=False)
-            st.success(f"✅ Metrics exported to: `{filepath}`")
-        except Exception as e:
-            st.error(f"❌ Error exporting metrics: {e}")
+    with col1:
+        if st.button("📥 Export Metrics (CSV)", use_container_width=True):
+            try:
+                metrics_result = st.session_state['evaluation_metrics']
+                from app.config.paths import EXPORTS_DIR
+                from app.analytics.reports import ReportService
+
+                reports = ReportService()
+                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+
+                # Create metrics summary
+                summary_df = pd.DataFrame([{
+                    'threshold': metrics_result['threshold'],
+                    'FAR': metrics_result['FAR'],
+                    'FRR': metrics_result['FRR'],
+                    'accuracy': metrics_result['accuracy'],
+                    'total_attempts': metrics_result['total_attempts'],
+                    'genuine_attempts': metrics_result['genuine_attempts'],
+                    'impostor_attempts': metrics_result['impostor_attempts'],
+                    'true_accepts': metrics_result['true_accepts'],
+                    'true_rejects': metrics_result['true_rejects'],
+                    'false_accepts': metrics_result['false_accepts'],
+                    'false_rejects': metrics_result['false_rejects'],
+                    'eer_threshold': eer_result['eer_threshold'],
+                    'eer_value': eer_result['eer_value']
+                }])
+
+                filepath = EXPORTS_DIR / f"evaluation_metrics_{timestamp}.csv"
+                filepath.parent.mkdir(parents=True, exist_ok=True)
+                summary_df.to_csv(filepath, index=False)
+                st.success(f"✅ Metrics exported to: `{filepath}`")
+            except Exception as e:
+                st.error(f"❌ Error exporting metrics: {e}")
 
-with col2:
-    if st.button("📊 Export Plots (PNG)", use_container_width=True):
-        try:
-            from app.config.paths import EXPORTS_DIR
-            import matplotlib.pyplot as plt
-            
-            output_dir = EXPORTS_DIR / "evaluation"
-            output_dir.mkdir(parents=True, exist_ok=True)
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            
-            # Generate and save all plots
-            fig1 = plots.score_distribution_histogram(df, backend='matplotlib')
-            if fig1:
-                plots.save_matplotlib_figure(fig1, output_dir / f"score_distribution_{timestamp}.png")
-                plt.close(fig1)
-            
-            fig2 = plots.genuine_vs_impostor_distribution(df, backend='matplotlib')
-            if fig2:
-                plots.save_matplotlib_figure(fig2, output_dir / f"genuine_impostor_{timestamp}.png")
-                plt.close(fig2)
-            
-            fig3 = plots.far_frr_curve(df, backend='matplotlib')
-            if fig3:
-                plots.save_matplotlib_figure(fig3, output_dir / f"far_frr_curve_{timestamp}.png")
-                plt.close(fig3)
-            
-            fig4 = plots.accuracy_curve(df, backend='matplotlib')
-            if fig4:
-                plots.save_matplotlib_figure(fig4, output_dir / f"accuracy_curve_{timestamp}.png")
-                plt.close(fig4)
-            
-            st.success(f"✅ Plots exported to: `{output_dir}`")
-        except Exception as e:
-            st.error(f"❌ Error exporting plots: {e}")
+    with col2:
+        if st.button("📊 Export Plots (PNG)", use_container_width=True):
+            try:
+                from app.config.paths import EXPORTS_DIR
+
+                output_dir = EXPORTS_DIR / "evaluation"
+                output_dir.mkdir(parents=True, exist_ok=True)
+                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+
+                plot_fns = {
+                    'score_distribution': (plots.score_distribution_histogram, {}),
+                    'genuine_impostor': (plots.genuine_vs_impostor_distribution, {}),
+                    'far_frr_curve': (plots.far_frr_curve, {'precomputed': sweep_df}),
+                    'accuracy_curve': (plots.accuracy_curve, {'precomputed': sweep_df})
+                }
+
+                def export_plot(name, plot_fn, kwargs):
+                    fig = plot_fn(df, backend='matplotlib', **kwargs)
+                    if fig:
+                        plots.save_matplotlib_figure(fig, output_dir / f"{name}_{timestamp}.png")
+
+                # Generate and save all plots concurrently - each builds an independent Figure
+                with ThreadPoolExecutor(max_workers=len(plot_fns)) as executor:
+                    futures = [executor.submit(export_plot, name, fn, kwargs) for name, (fn, kwargs) in plot_fns.items()]
+                    for future in futures:
+                        future.result()
+
+                st.success(f"✅ Plots exported to: `{output_dir}`")
+            except Exception as e:
+                st.error(f"❌ Error exporting plots: {e}")
+
+render_export(df, eer_result, sweep_df)
 
 # Footer
 st.markdown("---")
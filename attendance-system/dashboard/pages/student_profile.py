@@ -1,7 +1,5 @@
 import streamlit as st
-import pandas as pd
 import sys
-import os
 from pathlib import Path
 from datetime import datetime, timedelta
 
@@ -10,9 +8,6 @@ attendance_system_dir = str(Path(__file__).parent.parent.parent)
 if attendance_system_dir not in sys.path:
     sys.path.insert(0, attendance_system_dir)
 
-# Change working directory to attendance-system for proper module resolution
-os.chdir(attendance_system_dir)
-
 from app.analytics.student_metrics import StudentMetrics
 from dashboard.student_charts import StudentCharts
 from dashboard.auth import DashboardAuth
@@ -40,6 +35,27 @@ metrics = services['metrics']
 charts = services['charts']
 auth = services['auth']
 
+
+@st.cache_data(ttl=60)
+def _student_bundle(user_id, start_date, end_date):
+    """Load attendance history once and derive statistics, daily and score trends (cached)."""
+    return metrics.get_student_bundle(user_id, start_date=start_date, end_date=end_date)
+
+
+# Recent records render in a single table view; keep the result set small
+RECENT_RECORDS_MAX = 50
+
+
+@st.cache_data(ttl=60)
+def _recent_records(user_id, limit=20):
+    """Fetch recent attendance records for display (cached per user)."""
+    recent_df = metrics.get_student_recent_records(user_id, limit=min(limit, RECENT_RECORDS_MAX))
+    if recent_df.empty:
+        return recent_df
+    
+    # Nullable boolean: a NULL flag stays missing instead of showing as verified
+    return recent_df.astype({'face_verified': 'boolean', 'liveness_verified': 'boolean'})
+
 # Check authentication
 user = auth.get_user_session()
 if not user:
@@ -90,8 +106,9 @@ elif date_range_option == "Custom Range":
         start_date = None
         end_date = None
 
-# Load student statistics
-stats = metrics.get_student_statistics(user_id, start_date=start_date, end_date=end_date)
+# Load student history and derived statistics
+bundle = _student_bundle(user_id, start_date, end_date)
+stats = bundle['statistics']
 
 # Key Performance Indicators
 st.subheader("📊 My Statistics")
@@ -110,7 +127,7 @@ st.subheader("📈 My Attendance Analytics")
 col1, col2 = st.columns([2, 1])
 
 with col1:
-    daily_df = metrics.get_student_daily_summary(user_id, start_date=start_date, end_date=end_date)
+    daily_df = bundle['daily']
     timeline_chart = charts.personal_attendance_timeline(daily_df)
     if timeline_chart:
         st.plotly_chart(timeline_chart, use_container_width=True)
@@ -126,7 +143,7 @@ with col2:
 col1, col2 = st.columns(2)
 
 with col1:
-    score_df = metrics.get_student_score_trends(user_id, start_date=start_date, end_date=end_date)
+    score_df = bundle['score_trends']
     score_chart = charts.score_trend_chart(score_df)
     if score_chart:
         st.plotly_chart(score_chart, use_container_width=True)
@@ -141,7 +158,7 @@ with col2:
         st.info("No verification data available.")
 
 # Row 3: Weekly Pattern
-attendance_df = metrics.get_student_attendance_history(user_id, start_date=start_date, end_date=end_date)
+attendance_df = bundle['history']
 weekly_pattern = charts.weekly_attendance_pattern(attendance_df)
 if weekly_pattern:
     st.plotly_chart(weekly_pattern, use_container_width=True)
@@ -151,17 +168,21 @@ st.markdown("---")
 # Recent Records
 st.subheader("📋 Recent Attendance Records")
 
-recent_df = metrics.get_student_recent_records(user_id, limit=20)
+recent_df = _recent_records(user_id, limit=20)
 
 if not recent_df.empty:
-    # Format for display
-    display_df = recent_df[['timestamp', 'recognition_score', 'face_verified', 'liveness_verified']].copy()
-    display_df['timestamp'] = pd.to_datetime(display_df['timestamp']).dt.strftime('%Y-%m-%d %H:%M:%S')
-    display_df['face_verified'] = display_df['face_verified'].map({1: 'Yes', 0: 'No'})
-    display_df['liveness_verified'] = display_df['liveness_verified'].map({1: 'Yes', 0: 'No'})
-    display_df.columns = ['Date & Time', 'Recognition Score', 'Face Verified', 'Liveness Verified']
-    
-    st.dataframe(display_df, use_container_width=True, hide_index=True)
+    # Formatting is done by the front end via column_config
+    st.dataframe(
+        recent_df,
+        use_container_width=True,
+        hide_index=True,
+        column_config={
+            'timestamp': st.column_config.DatetimeColumn('Date & Time', format='YYYY-MM-DD HH:mm:ss'),
+            'recognition_score': st.column_config.NumberColumn('Recognition Score', format='%.3f'),
+            'face_verified': st.column_config.CheckboxColumn('Face Verified'),
+            'liveness_verified': st.column_config.CheckboxColumn('Liveness Verified')
+        }
+    )
 else:
     st.info("No recent attendance records available.")
 
@@ -1,7 +1,6 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
+import numpy as np
 
 
 class StudentCharts:
@@ -24,6 +23,7 @@ class StudentCharts:
         if daily_df.empty:
             return None
         
+        import plotly.express as px
         fig = px.line(
             daily_df,
             x='date',
@@ -53,6 +53,7 @@ class StudentCharts:
         Returns:
             Plotly figure
         """
+        import plotly.graph_objects as go
         fig = go.Figure(go.Indicator(
             mode="gauge+number+delta",
             value=attendance_rate,
@@ -91,6 +92,7 @@ class StudentCharts:
         if score_df.empty:
             return None
         
+        import plotly.express as px
         fig = px.line(
             score_df,
             x='date',
@@ -133,6 +135,7 @@ class StudentCharts:
         
         labels, values = zip(*filtered_data)
         
+        import plotly.express as px
         fig = px.bar(
             x=labels,
             y=values,
@@ -163,22 +166,22 @@ class StudentCharts:
         if attendance_df.empty or 'timestamp' not in attendance_df.columns:
             return None
         
-        df = attendance_df.copy()
-        df['day_of_week'] = pd.to_datetime(df['timestamp']).dt.day_name()
-        df['day_num'] = pd.to_datetime(df['timestamp']).dt.dayofweek
+        timestamps = attendance_df['timestamp']
+        if not pd.api.types.is_datetime64_any_dtype(timestamps):
+            timestamps = pd.to_datetime(timestamps, format='ISO8601')
         
-        # Order by day of week
+        # Count records per weekday (Monday=0) in one pass
+        day_num = timestamps.dt.dayofweek.dropna().to_numpy(dtype=np.int64)
+        counts = np.bincount(day_num, minlength=7)
         day_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-        weekly = df.groupby(['day_of_week', 'day_num']).size().reset_index(name='count')
-        weekly = weekly.sort_values('day_num')
         
+        import plotly.express as px
         fig = px.bar(
-            weekly,
-            x='day_of_week',
-            y='count',
+            x=day_order,
+            y=counts,
             title='Weekly Attendance Pattern',
-            labels={'day_of_week': 'Day of Week', 'count': 'Attendance Count'},
-            color='count',
+            labels={'x': 'Day of Week', 'y': 'Attendance Count'},
+            color=counts,
             color_continuous_scale='Blues'
         )
         fig.update_layout(
@@ -27,14 +27,15 @@ def main():
     
     db = DatabaseManager()
     
-    # Check users
-    users = db.execute_query("SELECT COUNT(*) as count FROM users")
-    user_count = dict(users[0])['count'] if users else 0
+    # Check users and attendance in one round trip
+    counts = db.execute_query("""
+        SELECT 
+            (SELECT COUNT(*) FROM users) as user_count,
+            (SELECT COUNT(*) FROM attendance) as attendance_count
+    """)
+    user_count = counts[0]['user_count'] if counts else 0
+    attendance_count = counts[0]['attendance_count'] if counts else 0
     print(f"Users in database: {user_count}")
-    
-    # Check attendance
-    attendance = db.execute_query("SELECT COUNT(*) as count FROM attendance")
-    attendance_count = dict(attendance[0])['count'] if attendance else 0
     print(f"Attendance records: {attendance_count}")
     print()
     
@@ -58,12 +59,12 @@ def main():
         ORDER BY face_verified DESC, system_decision
     """)
     
-    for row in breakdown:
-        r = dict(row)
-        face = "Genuine" if r['face_verified'] == 1 else "Impostor"
-        decision = r['system_decision'] or "NULL"
-        count = r['count']
-        print(f"  {face:10} + {decision:6} = {count:3d} records")
+    # sqlite3.Row supports access by column name - no dict() conversion needed
+    print("\n".join(
+        f"  {'Genuine' if r['face_verified'] == 1 else 'Impostor':10} + "
+        f"{r['system_decision'] or 'NULL':6} = {r['count']:3d} records"
+        for r in breakdown
+    ))
     
     print()
     print("=" * 60)
@@ -82,11 +83,12 @@ def main():
         LIMIT 5
     """)
     
-    for row in recent:
-        r = dict(row)
-        print(f"  User: {r['user_id']}, Score: {r['recognition_score']:.3f}, "
-              f"Face: {r['face_verified']}, Decision: {r['system_decision']}, "
-              f"Time: {r['timestamp']}")
+    print("\n".join(
+        f"  User: {r['user_id']}, Score: {r['recognition_score']:.3f}, "
+        f"Face: {r['face_verified']}, Decision: {r['system_decision']}, "
+        f"Time: {r['timestamp']}"
+        for r in recent
+    ))
 
 if __name__ == "__main__":
     main()
@@ -12,6 +12,8 @@ if parent_dir not in sys.path:
 
 from app.database.db_manager import DatabaseManager
 
+SAMPLE_LIMIT = 20
+
 def main():
     db = DatabaseManager()
     
@@ -20,45 +22,59 @@ def main():
     print("=" * 60)
     print()
     
-    # Check face mismatch records
-    query = """
+    # Classify face mismatch records in SQL - face mismatches should always be 'reject'
+    summary = db.execute_query("""
         SELECT 
-            user_id,
-            recognition_score,
-            face_verified,
-            system_decision,
-            threshold_used
+            COUNT(*) as total,
+            SUM(CASE 
+                WHEN system_decision IS NOT NULL AND system_decision != ''
+                     AND LOWER(system_decision) != 'reject' THEN 1
+                ELSE 0
+            END) as incorrect
         FROM attendance 
         WHERE face_verified = 0
-        ORDER BY timestamp DESC
-    """
+    """)
     
-    rows = db.execute_query(query)
+    total = summary[0]['total'] if summary else 0
+    incorrect = (summary[0]['incorrect'] or 0) if summary else 0
     
-    if not rows:
+    if total == 0:
         print("No face mismatch records found.")
         return
     
-    print(f"Found {len(rows)} face mismatch records:")
-    print("-" * 60)
+    print(f"Found {total} face mismatch records ({incorrect} incorrect)")
     
-    incorrect = 0
-    for row in rows:
-        r = dict(row)
-        user_id = r['user_id']
-        score = r['recognition_score']
-        decision = r['system_decision']
-        threshold = r['threshold_used']
-        
-        # Check if decision is correct
-        # Face mismatch should always be 'reject'
-        if decision and decision.lower() != 'reject':
-            status = "[INCORRECT]"
-            incorrect += 1
-        else:
-            status = "[OK]"
-        
-        print(f"{status} User: {user_id}, Score: {score:.3f}, Decision: {decision}, Threshold: {threshold}")
+    # Only a bounded sample is fetched for display; incorrect records sort first so the
+    # limit never hides them behind correct ones
+    sample = db.execute_query("""
+        SELECT 
+            user_id,
+            recognition_score,
+            system_decision,
+            threshold_used,
+            CASE 
+                WHEN system_decision IS NOT NULL AND system_decision != ''
+                     AND LOWER(system_decision) != 'reject' THEN '[INCORRECT]'
+                ELSE '[OK]'
+            END as status
+        FROM attendance 
+        WHERE face_verified = 0
+        ORDER BY status = '[OK]', timestamp DESC
+        LIMIT ?
+    """, (SAMPLE_LIMIT,))
+    
+    if total > len(sample):
+        print(f"Showing {len(sample)} (incorrect first, then most recent):")
+    print("-" * 60)
+    print("\n".join(
+        f"{r['status']} User: {r['user_id']}, Score: {r['recognition_score']:.3f}, "
+        f"Decision: {r['system_decision']}, Threshold: {r['threshold_used']}"
+        for r in sample
+    ))
+    if total > len(sample):
+        hidden = total - len(sample)
+        hidden_incorrect = incorrect - sum(r['status'] == '[INCORRECT]' for r in sample)
+        print(f"... and {hidden} more not shown ({hidden_incorrect} incorrect, {hidden - hidden_incorrect} OK)")
     
     print()
     print("=" * 60)
@@ -8,6 +8,7 @@ This script creates test attendance records to verify evaluation metrics work co
 import sys
 from pathlib import Path
 from datetime import datetime, timedelta
+from collections import Counter
 
 parent_dir = str(Path(__file__).parent.parent)
 if parent_dir not in sys.path:
@@ -17,6 +18,18 @@ from app.database.db_manager import DatabaseManager
 from app.database.models import Attendance
 from app.utils.logging import setup_logger
 
+_logger = None
+
+
+def _log():
+    """
+    Return the script logger, creating it (and opening the log file) on first use.
+    """
+    global _logger
+    _logger = _logger or setup_logger()
+    return _logger
+
+
 def create_test_records():
     """
     Create test records for all 4 outcome types:
@@ -25,7 +38,6 @@ def create_test_records():
     3. False Accept: Impostor (face_verified=0) + System Accept
     4. True Reject: Impostor (face_verified=0) + System Reject
     """
-    logger = setup_logger()
     db = DatabaseManager()
     attendance_model = Attendance(db)
     
@@ -48,140 +60,72 @@ def create_test_records():
     base_time = datetime.now()
     threshold = 0.5
     
-    test_cases = [
+    # Rows in INSERT parameter order:
+    # (user_id, recognition_score, face_verified, liveness_verified, threshold_used, system_decision, timestamp)
+    test_cases = (
         # True Accept: Genuine + Accept
-        {
-            "name": "True Accept",
-            "user_id": test_user_id,
-            "recognition_score": 0.85,  # High score, above threshold
-            "face_verified": 1,  # Genuine
-            "liveness_verified": 1,
-            "threshold_used": threshold,
-            "system_decision": "accept",  # System accepts
-            "timestamp": base_time - timedelta(hours=4)
-        },
-        {
-            "name": "True Accept",
-            "user_id": test_user_id,
-            "recognition_score": 0.75,
-            "face_verified": 1,
-            "liveness_verified": 1,
-            "threshold_used": threshold,
-            "system_decision": "accept",
-            "timestamp": base_time - timedelta(hours=3)
-        },
-        {
-            "name": "True Accept",
-            "user_id": test_user_id,
-            "recognition_score": 0.65,
-            "face_verified": 1,
-            "liveness_verified": 1,
-            "threshold_used": threshold,
-            "system_decision": "accept",
-            "timestamp": base_time - timedelta(hours=2)
-        },
+        (test_user_id, 0.85, 1, 1, threshold, "accept", base_time - timedelta(hours=4)),  # High score, above threshold
+        (test_user_id, 0.75, 1, 1, threshold, "accept", base_time - timedelta(hours=3)),
+        (test_user_id, 0.65, 1, 1, threshold, "accept", base_time - timedelta(hours=2)),
         
-        # False Reject: Genuine + Reject (legitimate user rejected)
-        {
-            "name": "False Reject",
-            "user_id": test_user_id,
-            "recognition_score": 0.45,  # Below threshold, but genuine user
-            "face_verified": 1,  # Genuine
-            "liveness_verified": 0,  # Liveness might have failed
-            "threshold_used": threshold,
-            "system_decision": "reject",  # System rejects (WRONG - should accept)
-            "timestamp": base_time - timedelta(hours=1)
-        },
-        {
-            "name": "False Reject",
-            "user_id": test_user_id,
-            "recognition_score": 0.40,  # Below threshold
-            "face_verified": 1,  # Genuine
-            "liveness_verified": 0,
-            "threshold_used": threshold,
-            "system_decision": "reject",
-            "timestamp": base_time - timedelta(minutes=30)
-        },
+        # False Reject: Genuine + Reject (legitimate user rejected - liveness might have failed)
+        (test_user_id, 0.45, 1, 0, threshold, "reject", base_time - timedelta(hours=1)),  # Below threshold, but genuine user
+        (test_user_id, 0.40, 1, 0, threshold, "reject", base_time - timedelta(minutes=30)),
         
         # False Accept: Impostor + Accept (impostor gets through)
-        {
-            "name": "False Accept",
-            "user_id": test_user_id,
-            "recognition_score": 0.75,  # High score, above threshold
-            "face_verified": 0,  # Impostor (face mismatch)
-            "liveness_verified": 0,
-            "threshold_used": threshold,
-            "system_decision": "accept",  # System accepts (WRONG - should reject)
-            "timestamp": base_time - timedelta(minutes=20)
-        },
-        {
-            "name": "False Accept",
-            "user_id": test_user_id,
-            "recognition_score": 0.68,  # Above threshold
-            "face_verified": 0,  # Impostor
-            "liveness_verified": 0,
-            "threshold_used": threshold,
-            "system_decision": "accept",  # System accepts (WRONG)
-            "timestamp": base_time - timedelta(minutes=10)
-        },
+        (test_user_id, 0.75, 0, 0, threshold, "accept", base_time - timedelta(minutes=20)),  # High score, face mismatch
+        (test_user_id, 0.68, 0, 0, threshold, "accept", base_time - timedelta(minutes=10)),
         
         # True Reject: Impostor + Reject (correctly rejected)
-        {
-            "name": "True Reject",
-            "user_id": test_user_id,
-            "recognition_score": 0.35,  # Low score, below threshold
-            "face_verified": 0,  # Impostor
-            "liveness_verified": 0,
-            "threshold_used": threshold,
-            "system_decision": "reject",  # System rejects (CORRECT)
-            "timestamp": base_time - timedelta(minutes=5)
-        },
-        {
-            "name": "True Reject",
-            "user_id": test_user_id,
-            "recognition_score": 0.42,  # Below threshold
-            "face_verified": 0,  # Impostor
-            "liveness_verified": 0,
-            "threshold_used": threshold,
-            "system_decision": "reject",  # System rejects (CORRECT)
-            "timestamp": base_time - timedelta(minutes=2)
-        },
-    ]
+        (test_user_id, 0.35, 0, 0, threshold, "reject", base_time - timedelta(minutes=5)),  # Low score, below threshold
+        (test_user_id, 0.42, 0, 0, threshold, "reject", base_time - timedelta(minutes=2)),
+    )
+    # Outcome label per row, used only for reporting
+    names = (
+        "True Accept", "True Accept", "True Accept",
+        "False Reject", "False Reject",
+        "False Accept", "False Accept",
+        "True Reject", "True Reject",
+    )
     
     print("Creating test records:")
     print("-" * 60)
     
-    created_count = 0
-    for i, test_case in enumerate(test_cases, 1):
-        try:
-            # Insert directly into database with custom timestamp
-            with db.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute("""
-                    INSERT INTO attendance 
-                    (user_id, recognition_score, face_verified, liveness_verified, 
-                     threshold_used, system_decision, timestamp)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    test_case["user_id"],
-                    test_case["recognition_score"],
-                    test_case["face_verified"],
-                    test_case["liveness_verified"],
-                    test_case["threshold_used"],
-                    test_case["system_decision"],
-                    test_case["timestamp"]
-                ))
-                conn.commit()
-            
-            print(f"{i}. {test_case['name']:15} | "
-                  f"Score: {test_case['recognition_score']:.2f} | "
-                  f"Face: {test_case['face_verified']} | "
-                  f"Decision: {test_case['system_decision']}")
-            created_count += 1
-            
-        except Exception as e:
-            logger.error(f"Failed to create test record {i}: {e}")
-            print(f"  [ERROR] Failed to create: {e}")
+    columns = (
+        'user_id', 'recognition_score', 'face_verified', 'liveness_verified',
+        'threshold_used', 'system_decision', 'timestamp'
+    )
+    insert_query = f"""
+        INSERT INTO attendance ({', '.join(columns)})
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    """
+    
+    try:
+        # One prepared statement and a single commit instead of one per record
+        db.bulk_insert('attendance', columns, test_cases)
+        created = [True] * len(test_cases)
+    except Exception as e:
+        _log().warning(f"Batch insert failed ({e}), retrying record by record")
+        # Retry row by row (still one transaction) so the failing record can be reported
+        created = []
+        with db.get_connection() as conn:
+            for i, row in enumerate(test_cases, 1):
+                try:
+                    conn.execute(insert_query, row)
+                    created.append(True)
+                except Exception as row_error:
+                    _log().error(f"Failed to create test record {i}: {row_error}")
+                    print(f"  [ERROR] Failed to create record {i}: {row_error}")
+                    created.append(False)
+    
+    for i, (name, row, ok) in enumerate(zip(names, test_cases, created), 1):
+        if ok:
+            print(f"{i}. {name:15} | "
+                  f"Score: {row[1]:.2f} | "
+                  f"Face: {row[2]} | "
+                  f"Decision: {row[5]}")
+    
+    created_count = sum(created)
     
     print()
     print("=" * 60)
@@ -189,10 +133,11 @@ def create_test_records():
     print("=" * 60)
     print()
     print("Test data breakdown:")
-    print("  - True Accepts:  3 (genuine + accept)")
-    print("  - False Rejects: 2 (genuine + reject)")
-    print("  - False Accepts: 2 (impostor + accept)")
-    print("  - True Rejects:  2 (impostor + reject)")
+    breakdown = Counter(names)
+    print(f"  - True Accepts:  {breakdown['True Accept']} (genuine + accept)")
+    print(f"  - False Rejects: {breakdown['False Reject']} (genuine + reject)")
+    print(f"  - False Accepts: {breakdown['False Accept']} (impostor + accept)")
+    print(f"  - True Rejects:  {breakdown['True Reject']} (impostor + reject)")
     print()
     print("Now run evaluation to see the metrics:")
     print("  python scripts/run_evaluation.py")
@@ -5,7 +5,6 @@ Debug load_attendance to see what's happening.
 
 import sys
 from pathlib import Path
-import pandas as pd
 
 parent_dir = str(Path(__file__).parent.parent)
 if parent_dir not in sys.path:
@@ -41,45 +40,35 @@ def main():
     
     try:
         with db.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(query, ())
-            rows = cursor.fetchall()
+            # Deferred: pandas dominates this script's startup time
+            import pandas as pd
             
-            print(f"Rows fetched: {len(rows)}")
-            print(f"Row type: {type(rows[0]) if rows else 'No rows'}")
+            # Columnar load straight from the cursor - no per-row dict() materialisation
+            # Nullable Int8 keeps NULL flags representable; ISO8601 covers timestamps with/without microseconds
+            df = pd.read_sql_query(
+                query,
+                conn,
+                parse_dates={'timestamp': {'format': 'ISO8601'}},
+                dtype={
+                    'face_verified': 'Int8',
+                    'liveness_verified': 'Int8',
+                    'recognition_score': 'float32'
+                }
+            )
+            
+            print(f"Rows fetched: {len(df)}")
             print()
             
-            if rows:
-                first_row = rows[0]
-                print(f"First row: {first_row}")
-                print(f"First row type: {type(first_row)}")
-                print(f"Has keys(): {hasattr(first_row, 'keys')}")
-                
-                if hasattr(first_row, 'keys'):
-                    print(f"Keys: {first_row.keys()}")
-                    print(f"dict(row): {dict(first_row)}")
+            if not df.empty:
+                print(f"First row: {df.iloc[0].to_dict()}")
                 print()
                 
-                # Try converting
-                print("Converting rows to dicts...")
-                data = []
-                for i, row in enumerate(rows[:3]):  # Just first 3
-                    try:
-                        if hasattr(row, 'keys'):
-                            d = dict(row)
-                            print(f"  Row {i}: {d}")
-                            data.append(d)
-                        else:
-                            print(f"  Row {i}: Not a Row object, type={type(row)}")
-                    except Exception as e:
-                        print(f"  Row {i}: Error converting - {e}")
-                
-                print()
-                print("Creating DataFrame...")
-                df = pd.DataFrame(data)
                 print(f"DataFrame shape: {df.shape}")
                 print(f"DataFrame columns: {list(df.columns)}")
                 print()
+                print("DataFrame dtypes:")
+                print(df.dtypes)
+                print()
                 print("DataFrame head:")
                 print(df.head())
                 
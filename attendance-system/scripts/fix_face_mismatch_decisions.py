@@ -14,8 +14,21 @@ if parent_dir not in sys.path:
 from app.database.db_manager import DatabaseManager
 from app.utils.logging import setup_logger
 
+_logger = None
+
+
+def _log():
+    """
+    Return the script logger, creating it (and opening the log file) on first use.
+    """
+    global _logger
+    _logger = _logger or setup_logger()
+    return _logger
+
+
 def main():
-    logger = setup_logger()
+    import pandas as pd
+    
     db = DatabaseManager()
     
     print("=" * 60)
@@ -25,59 +38,53 @@ def main():
     
     try:
         with db.get_connection() as conn:
-            cursor = conn.cursor()
-            
-            # Find face mismatch records with incorrect system_decision
-            cursor.execute("""
+            # Find face mismatch records with incorrect system_decision (columnar, not per-row tuples)
+            incorrect = pd.read_sql_query("""
                 SELECT id, user_id, recognition_score, system_decision
                 FROM attendance
                 WHERE face_verified = 0 
                 AND (system_decision IS NULL OR system_decision != 'reject')
-            """)
+            """, conn, dtype={'recognition_score': 'float32'})
             
-            incorrect_records = cursor.fetchall()
-            
-            if not incorrect_records:
+            if incorrect.empty:
                 print("[OK] No records need fixing. All face mismatches already have system_decision='reject'")
                 return
             
-            print(f"Found {len(incorrect_records)} records to fix:")
+            print(f"Found {len(incorrect)} records to fix:")
             print("-" * 60)
             
-            for record in incorrect_records:
-                record_id = record[0]
-                user_id = record[1]
-                score = record[2]
-                old_decision = record[3]
-                print(f"  ID: {record_id}, User: {user_id}, Score: {score:.3f}, Old Decision: {old_decision}")
+            # Build every line column-wise and write them in one call
+            lines = (
+                "  ID: " + incorrect['id'].astype(str)
+                + ", User: " + incorrect['user_id'].astype(str)
+                + ", Score: " + incorrect['recognition_score'].map('{:.3f}'.format)
+                + ", Old Decision: " + incorrect['system_decision'].astype(str)
+            )
+            print("\n".join(lines))
             
             print()
-            print("Updating records...")
-            
-            # Update all face mismatch records to have system_decision='reject'
-            cursor.execute("""
-                UPDATE attendance
-                SET system_decision = 'reject'
-                WHERE face_verified = 0 
-                AND (system_decision IS NULL OR system_decision != 'reject')
-            """)
-            
-            updated = cursor.rowcount
-            conn.commit()
-            
-            print(f"[OK] Updated {updated} records")
-            print()
-            print("=" * 60)
-            print("[SUCCESS] All face mismatch records now have system_decision='reject'")
-            print("=" * 60)
-            
-            logger.info(f"Fixed {updated} face mismatch records with incorrect system_decision")
-            
+        
+        print("Updating records...")
+        
+        # Update exactly the records listed above, in one transaction on the shared connection
+        updated = db.bulk_update(
+            "UPDATE attendance SET system_decision = 'reject' WHERE id = ?",
+            [(record_id,) for record_id in incorrect['id'].tolist()]
+        )
+        
+        print(f"[OK] Updated {updated} records")
+        print()
+        print("=" * 60)
+        print("[SUCCESS] All face mismatch records now have system_decision='reject'")
+        print("=" * 60)
+        
+        _log().info(f"Fixed {updated} face mismatch records with incorrect system_decision")
+        
     except Exception as e:
-        logger.error(f"Failed to fix records: {e}")
+        _log().error(f"Failed to fix records: {e}")
         print(f"[ERROR] Failed to fix records: {e}")
         import traceback
-        logger.error(traceback.format_exc())
+        _log().error(traceback.format_exc())
         raise
 
 if __name__ == "__main__":
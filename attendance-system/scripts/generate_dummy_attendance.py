@@ -7,7 +7,8 @@ Useful for testing analytics and evaluation metrics.
 import sys
 from pathlib import Path
 from datetime import datetime, timedelta
-import random
+from collections import Counter
+import numpy as np
 
 parent_dir = str(Path(__file__).parent.parent)
 if parent_dir not in sys.path:
@@ -16,8 +17,25 @@ if parent_dir not in sys.path:
 from app.database.db_manager import DatabaseManager
 from app.utils.logging import setup_logger
 
+# Column order of the generated record tuples
+ATTENDANCE_COLUMNS = (
+    'user_id', 'recognition_score', 'face_verified', 'liveness_verified',
+    'threshold_used', 'system_decision', 'timestamp'
+)
+
+_logger = None
+
+
+def _log():
+    """
+    Return the script logger, creating it (and opening the log file) on first use.
+    """
+    global _logger
+    _logger = _logger or setup_logger()
+    return _logger
+
+
 def main():
-    logger = setup_logger()
     db = DatabaseManager()
     
     print("=" * 60)
@@ -58,67 +76,86 @@ def main():
     ]
     
     threshold = 0.5
-    records_created = 0
     
     # Generate timestamps spread over 30 days
     # Mix of weekdays and weekends, different times of day
-    timestamps = []
-    for i in range(100):
-        # Random day within the month
-        days_offset = random.randint(0, 29)
-        date = start_date + timedelta(days=days_offset)
-        
-        # Random time (8 AM to 6 PM, weighted towards morning)
-        hour = random.choices(
-            range(8, 19),
-            weights=[3, 3, 4, 4, 3, 2, 2, 2, 1, 1, 1]  # More weight to 8-11 AM
-        )[0]
-        minute = random.randint(0, 59)
-        second = random.randint(0, 59)
-        
-        timestamp = date.replace(hour=hour, minute=minute, second=second)
-        timestamps.append(timestamp)
-    
-    # Sort timestamps chronologically
+    rng = np.random.default_rng()
+    num_records = 100
+    
+    # Random day within the month
+    days = rng.integers(0, 30, num_records)
+    # Random time (8 AM to 6 PM, weighted towards morning)
+    hour_weights = np.array([3, 3, 4, 4, 3, 2, 2, 2, 1, 1, 1])  # More weight to 8-11 AM
+    hours = rng.choice(np.arange(8, 19), size=num_records, p=hour_weights / hour_weights.sum())
+    minutes = rng.integers(0, 60, num_records)
+    seconds = rng.integers(0, 60, num_records)
+    
+    base = np.datetime64(start_date.replace(hour=0, minute=0, second=0, microsecond=0), 's')
+    timestamps = (
+        base
+        + days.astype('timedelta64[D]')
+        + hours.astype('timedelta64[h]')
+        + minutes.astype('timedelta64[m]')
+        + seconds.astype('timedelta64[s]')
+    )
+    
+    # Sort timestamps chronologically; convert to datetimes only for parameter binding
     timestamps.sort()
+    timestamps = timestamps.tolist()
     
-    # Generate records
+    # Build all records up front, then insert them in one transaction
+    all_records = []
+    record_labels = []
     record_idx = 0
     
-    for outcome_name, face_verified, system_decision, count, score_range in outcome_configs:
+    # Pre-sample every record's user in one draw (tolist() so sqlite3 binds plain str)
+    record_user_ids = rng.choice(user_ids, size=num_records).tolist()
+    
+    for outcome_name, face_verified, system_decision, count, (score_low, score_high) in outcome_configs:
         print(f"Creating {count} {outcome_name} records...")
         
-        for i in range(count):
-            user_id = random.choice(user_ids)
-            recognition_score = round(random.uniform(*score_range), 3)
-            liveness_verified = 1 if face_verified == 1 and system_decision == "accept" else random.choice([0, 1])
-            timestamp = timestamps[record_idx]
-            
-            try:
-                with db.get_connection() as conn:
-                    cursor = conn.cursor()
-                    cursor.execute("""
-                        INSERT INTO attendance 
-                        (user_id, recognition_score, face_verified, liveness_verified, 
-                         threshold_used, system_decision, timestamp)
-                        VALUES (?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                        user_id,
-                        recognition_score,
-                        face_verified,
-                        liveness_verified,
-                        threshold,
-                        system_decision,
-                        timestamp
-                    ))
-                    conn.commit()
-                
-                records_created += 1
-                record_idx += 1
-                
-            except Exception as e:
-                logger.error(f"Failed to create record {i+1} of {outcome_name}: {e}")
-                print(f"  [ERROR] Failed: {e}")
+        # One batched draw per block instead of a random.uniform()/round() call per record
+        scores = rng.uniform(score_low, score_high, count).round(3).tolist()
+        
+        # Accepted genuine attempts always passed liveness; the rest are a coin flip
+        if face_verified == 1 and system_decision == "accept":
+            liveness_flags = [1] * count
+        else:
+            liveness_flags = rng.integers(0, 2, count).tolist()
+        
+        block = slice(record_idx, record_idx + count)
+        all_records.extend(
+            (user_id, recognition_score, face_verified, liveness_verified, threshold, system_decision, timestamp)
+            for user_id, recognition_score, liveness_verified, timestamp
+            in zip(record_user_ids[block], scores, liveness_flags, timestamps[block])
+        )
+        record_labels.extend(f"record {i+1} of {outcome_name}" for i in range(count))
+        record_idx += count
+    
+    insert_query = f"""
+        INSERT INTO attendance ({', '.join(ATTENDANCE_COLUMNS)})
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    """
+    
+    try:
+        # Single prepared statement + single commit on the shared connection; for large
+        # batches the secondary indexes are rebuilt once instead of maintained per row
+        db.bulk_insert('attendance', ATTENDANCE_COLUMNS, all_records, defer_indexes=True)
+        inserted = all_records
+    except Exception as e:
+        _log().warning(f"Batch insert failed ({e}), retrying record by record")
+        # Retry individually (still one transaction) so failing records are reported
+        inserted = []
+        with db.get_connection() as conn:
+            for label, record in zip(record_labels, all_records):
+                try:
+                    conn.execute(insert_query, record)
+                    inserted.append(record)
+                except Exception as row_error:
+                    _log().error(f"Failed to create {label}: {row_error}")
+                    print(f"  [ERROR] Failed: {row_error}")
+    
+    records_created = len(inserted)
     
     print()
     print("=" * 60)
@@ -126,44 +163,22 @@ def main():
     print("=" * 60)
     print()
     
-    # Show summary
-    summary = db.execute_query("""
-        SELECT 
-            face_verified,
-            system_decision,
-            COUNT(*) as count
-        FROM attendance
-        WHERE timestamp >= ?
-        GROUP BY face_verified, system_decision
-        ORDER BY face_verified DESC, system_decision
-    """, (start_date.strftime('%Y-%m-%d'),))
+    # Summarise from the inserted records themselves - no need to query them back
+    # (record tuple: user_id, score, face_verified, liveness, threshold, decision, timestamp)
+    summary = Counter((record[2], record[5]) for record in inserted)
     
     print("Summary of generated records:")
     print("-" * 60)
-    for row in summary:
-        r = dict(row)
-        face = "Genuine" if r['face_verified'] == 1 else "Impostor"
-        decision = r['system_decision']
-        count = r['count']
+    for (face_verified, decision), count in sorted(summary.items(), key=lambda item: (-item[0][0], item[0][1])):
+        face = "Genuine" if face_verified == 1 else "Impostor"
         print(f"  {face:10} + {decision:6} = {count:3d} records")
     
     print()
     print("Date range coverage:")
-    date_range = db.execute_query("""
-        SELECT 
-            DATE(timestamp) as date,
-            COUNT(*) as count
-        FROM attendance
-        WHERE timestamp >= ?
-        GROUP BY DATE(timestamp)
-        ORDER BY date
-    """, (start_date.strftime('%Y-%m-%d'),))
-    
-    if date_range:
-        first_date = dict(date_range[0])['date']
-        last_date = dict(date_range[-1])['date']
-        total_days = len(date_range)
-        print(f"  Dates: {first_date} to {last_date} ({total_days} days with records)")
+    dates = sorted({record[6].date() for record in inserted})
+    
+    if dates:
+        print(f"  Dates: {dates[0]} to {dates[-1]} ({len(dates)} days with records)")
     
     print()
     print("You can now run evaluation:")
@@ -9,18 +9,12 @@ Usage:
 
 import sys
 from pathlib import Path
-import pandas as pd
 
 # Add parent directory to path
 parent_dir = str(Path(__file__).parent.parent)
 if parent_dir not in sys.path:
     sys.path.insert(0, parent_dir)
 
-from app.database.db_manager import DatabaseManager
-from app.database.models import Attendance
-from app.analytics.evaluation import AttendanceEvaluation
-from app.analytics.metrics import AttendanceMetrics
-
 
 def main():
     print("=" * 60)
@@ -28,26 +22,36 @@ def main():
     print("=" * 60)
     print()
     
-    # Load attendance data
+    # Analytics (and pandas with them) are imported only when the script actually runs
+    from app.analytics.metrics import AttendanceMetrics
+    
+    # Counts come from one aggregate query - genuine rows are never loaded
     print("Loading attendance data...")
     metrics = AttendanceMetrics()
-    df = metrics.load_attendance()
+    counts = metrics.db.execute_query("""
+        SELECT 
+            COUNT(*) AS total,
+            COALESCE(SUM(CASE WHEN face_verified = 1 THEN 1 ELSE 0 END), 0) AS genuine
+        FROM attendance
+    """)[0]
     
-    if df.empty:
+    if counts['total'] == 0:
         print("No attendance data found in database.")
         return
     
-    print(f"Total attendance records: {len(df)}")
+    print(f"Total attendance records: {counts['total']}")
     print()
     
-    # Split into genuine and impostor
-    evaluator = AttendanceEvaluation()
-    genuine, impostor = evaluator.get_genuine_impostor_split(df)
+    # Impostor attempts (face_verified == 0) are filtered in SQL; only the displayed
+    # columns are read unless the full records are being exported
+    display_cols = ['user_id', 'name', 'recognition_score', 'face_verified', 'liveness_verified', 'timestamp']
+    export_csv = '--export-csv' in sys.argv
+    impostor = metrics.load_attendance(columns=None if export_csv else display_cols, face_verified=0)
     
     print("=" * 60)
     print("SUMMARY")
     print("=" * 60)
-    print(f"Genuine Attempts: {len(genuine)}")
+    print(f"Genuine Attempts: {counts['genuine']}")
     print(f"Impostor Attempts: {len(impostor)}")
     print()
     
@@ -83,18 +87,16 @@ def main():
     print("Detailed Records:")
     print("-" * 60)
     
-    display_cols = ['user_id', 'name', 'recognition_score', 'face_verified', 'liveness_verified', 'timestamp']
-    available_cols = [col for col in display_cols if col in impostor.columns]
-    
-    pd.set_option('display.max_rows', None)
-    pd.set_option('display.width', None)
-    pd.set_option('display.max_columns', None)
-    
-    print(impostor[available_cols].to_string(index=False))
+    # Stream aligned rows rather than formatting the whole table into one string
+    # (and without changing pandas' global display options)
+    row_format = "{:<10}{:<20}{:>8}{:>6}{:>10}  {}"
+    print(row_format.format('user_id', 'name', 'score', 'face', 'liveness', 'timestamp'))
+    for user_id, name, score, face, liveness, timestamp in impostor[display_cols].itertuples(index=False, name=None):
+        print(row_format.format(user_id, str(name), f"{score:.3f}", face, liveness, str(timestamp)))
     print()
     
     # Export option
-    if '--export-csv' in sys.argv:
+    if export_csv:
         from app.config.paths import EXPORTS_DIR
         from datetime import datetime
         
@@ -14,8 +14,55 @@ if parent_dir not in sys.path:
 from app.database.db_manager import DatabaseManager
 from app.utils.logging import setup_logger
 
+# Below this many undecided rows the SQL CASE update is fast enough; above it the
+# decisions are computed in one compiled pass and written back by id
+NUMBA_MIN_ROWS = 10_000
+
+_logger = None
+
+
+def _log():
+    """
+    Return the script logger, creating it (and opening the log file) on first use.
+    """
+    global _logger
+    _logger = _logger or setup_logger()
+    return _logger
+
+
+def compute_decisions(conn, threshold):
+    """
+    Classify rows lacking a system_decision outside SQLite.
+    
+    Args:
+        conn: Open database connection
+        threshold: Similarity threshold for an 'accept' decision
+        
+    Returns:
+        List of (decision, id) pairs for rows with a recognition score
+    """
+    import numpy as np
+    import pandas as pd
+    from app.analytics._eer_kernel import classify_scores
+    
+    # float64 keeps the comparison identical to SQLite's REAL >= ? in the CASE path
+    undecided = pd.read_sql_query(
+        "SELECT id, recognition_score FROM attendance WHERE system_decision IS NULL",
+        conn,
+        dtype={'recognition_score': 'float64'}
+    )
+    scores = undecided['recognition_score'].to_numpy()
+    is_null = np.empty(len(scores), dtype=np.bool_)
+    is_accept = np.empty(len(scores), dtype=np.bool_)
+    classify_scores(scores, threshold, is_null, is_accept)
+    
+    # Rows without a score keep a NULL decision, so they need no write
+    decisions = np.where(is_accept, 'accept', 'reject')[~is_null]
+    ids = undecided['id'].to_numpy()[~is_null]
+    return list(zip(decisions.tolist(), ids.tolist()))
+
+
 def migrate():
-    logger = setup_logger()
     db = DatabaseManager()
     
     try:
@@ -30,54 +77,85 @@ def migrate():
             if 'threshold_used' not in columns:
                 try:
                     cursor.execute("ALTER TABLE attendance ADD COLUMN threshold_used REAL DEFAULT 0.5")
-                    logger.info("Added threshold_used column")
+                    _log().info("Added threshold_used column")
                     print("[OK] Added threshold_used column")
                 except Exception as e:
-                    logger.error(f"Failed to add threshold_used column: {e}")
+                    _log().error(f"Failed to add threshold_used column: {e}")
                     print(f"[WARNING] threshold_used column may already exist: {e}")
             else:
-                logger.info("threshold_used column already exists")
+                _log().info("threshold_used column already exists")
                 print("[INFO] threshold_used column already exists")
             
             # Add system_decision if not exists
             if 'system_decision' not in columns:
                 try:
                     cursor.execute("ALTER TABLE attendance ADD COLUMN system_decision TEXT")
-                    logger.info("Added system_decision column")
+                    _log().info("Added system_decision column")
                     print("[OK] Added system_decision column")
                 except Exception as e:
-                    logger.error(f"Failed to add system_decision column: {e}")
+                    _log().error(f"Failed to add system_decision column: {e}")
                     print(f"[WARNING] system_decision column may already exist: {e}")
             else:
-                logger.info("system_decision column already exists")
+                _log().info("system_decision column already exists")
                 print("[INFO] system_decision column already exists")
             
             # Update existing records with default threshold and computed decision
             from app.config.settings import SIMILARITY_THRESHOLD
             
+            # Stop at the first row that still needs filling instead of scanning the whole table
+            # (rows without a score keep a NULL decision, so they never need an update)
+            needs_update = cursor.execute("""
+                SELECT 1 FROM attendance
+                WHERE threshold_used IS NULL
+                   OR (system_decision IS NULL AND recognition_score IS NOT NULL)
+                LIMIT 1
+            """).fetchone()
+            if not needs_update:
+                _log().info("No attendance rows need migration")
+                print("[INFO] No rows need migration")
+                print("\n[SUCCESS] Migration completed successfully!")
+                return
+            
+            # Fill each column only where it is missing - rows with an existing decision keep it,
+            # and the CASE is evaluated only for rows that actually lack a decision
             cursor.execute("""
                 UPDATE attendance 
-                SET threshold_used = ?,
-                    system_decision = CASE 
-                        WHEN recognition_score IS NULL THEN NULL
-                        WHEN recognition_score >= ? THEN 'accept'
-                        ELSE 'reject'
-                    END
-                WHERE threshold_used IS NULL OR system_decision IS NULL
-            """, (SIMILARITY_THRESHOLD, SIMILARITY_THRESHOLD))
+                SET threshold_used = ?
+                WHERE threshold_used IS NULL
+            """, (SIMILARITY_THRESHOLD,))
+            updated_thresholds = cursor.rowcount
+            
+            cursor.execute("SELECT COUNT(*) FROM attendance WHERE system_decision IS NULL")
+            undecided_count = cursor.fetchone()[0]
+            
+            if undecided_count >= NUMBA_MIN_ROWS:
+                pairs = compute_decisions(conn, SIMILARITY_THRESHOLD)
+                cursor.executemany("UPDATE attendance SET system_decision = ? WHERE id = ?", pairs)
+                updated_decisions = len(pairs)
+            else:
+                cursor.execute("""
+                    UPDATE attendance 
+                    SET system_decision = CASE 
+                            WHEN recognition_score IS NULL THEN NULL
+                            WHEN recognition_score >= ? THEN 'accept'
+                            ELSE 'reject'
+                        END
+                    WHERE system_decision IS NULL
+                """, (SIMILARITY_THRESHOLD,))
+                updated_decisions = cursor.rowcount
             
-            updated = cursor.rowcount
-            logger.info(f"Updated {updated} existing records with threshold and system_decision")
-            print(f"[OK] Updated {updated} existing records with threshold and system_decision")
+            _log().info(f"Updated threshold_used on {updated_thresholds} and system_decision on {updated_decisions} existing records")
+            print(f"[OK] Updated threshold_used on {updated_thresholds} existing records")
+            print(f"[OK] Updated system_decision on {updated_decisions} existing records")
             
             conn.commit()
             print("\n[SUCCESS] Migration completed successfully!")
             
     except Exception as e:
-        logger.error(f"Migration failed: {e}")
+        _log().error(f"Migration failed: {e}")
         print(f"[ERROR] Migration failed: {e}")
         import traceback
-        logger.error(traceback.format_exc())
+        _log().error(traceback.format_exc())
         raise
 
 if __name__ == "__main__":
@@ -21,7 +21,7 @@ def main():
     
     # Load data
     metrics = AttendanceMetrics()
-    df = metrics.load_attendance()
+    df = metrics.load_attendance(use_cache=True)
     
     if df.empty:
         print("[ERROR] No data found. Run:")
@@ -7,23 +7,43 @@ Usage:
     python scripts/run_evaluation.py
     python scripts/run_evaluation.py --threshold 0.5
     python scripts/run_evaluation.py --start-date 2024-01-01 --end-date 2024-12-31
+    python scripts/run_evaluation.py --hq
 """
 
 import sys
 import argparse
 from pathlib import Path
-from datetime import datetime
+from datetime import date, datetime
 
 # Add parent directory to path
 parent_dir = str(Path(__file__).parent.parent)
 if parent_dir not in sys.path:
     sys.path.insert(0, parent_dir)
 
-from app.analytics.metrics import AttendanceMetrics
-from app.analytics.data_cleaning import DataCleaning
-from app.analytics.evaluation import AttendanceEvaluation
-from app.analytics.plots import EvaluationPlots
-from app.config.paths import EXPORTS_DIR
+# PNG output settings: quick-look plots by default, publication quality with --hq
+PLOT_SAVE_FAST = {'dpi': 100, 'compress_level': 1}
+PLOT_SAVE_HQ = {'dpi': 300}
+
+
+def _render_plot(task):
+    """
+    Render one evaluation plot and save it as PNG (runs in a worker process).
+    
+    Args:
+        task: Tuple of (df, EvaluationPlots method name, extra kwargs, output path,
+              save_matplotlib_figure kwargs)
+    """
+    import matplotlib
+    matplotlib.use('Agg')  # Non-interactive backend in the worker
+    from app.analytics.plots import EvaluationPlots
+    
+    df, method, kwargs, path, save_kwargs = task
+    plots = EvaluationPlots()
+    fig = getattr(plots, method)(df, backend='matplotlib', **kwargs)
+    if fig:
+        plots.save_matplotlib_figure(fig, path, **save_kwargs)
+        # Plain Figure objects are not registered with pyplot, so clearing is all the cleanup needed
+        fig.clf()
 
 
 def main():
@@ -38,6 +58,8 @@ def main():
                        help='Skip data cleaning')
     parser.add_argument('--output-dir', type=str, default=None,
                        help='Output directory for plots (default: data/exports/evaluation)')
+    parser.add_argument('--hq', action='store_true',
+                       help='Save plots at 300 DPI with default PNG compression (slower)')
     
     args = parser.parse_args()
     
@@ -46,6 +68,26 @@ def main():
         print("Error: Threshold must be between 0.0 and 1.0")
         return 1
     
+    # Validate dates
+    try:
+        start_date = date.fromisoformat(args.start_date) if args.start_date else None
+    except ValueError:
+        print(f"Error: Invalid start date format: {args.start_date}. Use YYYY-MM-DD")
+        return 1
+    
+    try:
+        end_date = date.fromisoformat(args.end_date) if args.end_date else None
+    except ValueError:
+        print(f"Error: Invalid end date format: {args.end_date}. Use YYYY-MM-DD")
+        return 1
+    
+    # Imported only once arguments are valid, so --help and usage errors return immediately
+    from concurrent.futures import ProcessPoolExecutor
+    from app.analytics.metrics import AttendanceMetrics
+    from app.analytics.data_cleaning import DataCleaning
+    from app.analytics.evaluation import AttendanceEvaluation
+    from app.config.paths import EXPORTS_DIR
+    
     # Set output directory
     if args.output_dir:
         output_dir = Path(args.output_dir)
@@ -69,23 +111,7 @@ def main():
     print("Loading attendance data...")
     metrics = AttendanceMetrics()
     
-    start_date = None
-    end_date = None
-    if args.start_date:
-        try:
-            start_date = datetime.strptime(args.start_date, '%Y-%m-%d').date()
-        except ValueError:
-            print(f"Error: Invalid start date format: {args.start_date}. Use YYYY-MM-DD")
-            return 1
-    
-    if args.end_date:
-        try:
-            end_date = datetime.strptime(args.end_date, '%Y-%m-%d').date()
-        except ValueError:
-            print(f"Error: Invalid end date format: {args.end_date}. Use YYYY-MM-DD")
-            return 1
-    
-    df = metrics.load_attendance(start_date=start_date, end_date=end_date)
+    df = metrics.load_attendance(start_date=start_date, end_date=end_date, use_cache=True)
     
     if df.empty:
         print("Error: No attendance data found for the specified filters.")
@@ -140,7 +166,9 @@ def main():
     
     # Find EER
     print("Computing Equal Error Rate (EER)...")
-    eer_result = evaluator.find_eer_threshold(df)
+    # Sweep thresholds once; the EER search and both curve plots reuse it
+    sweep_df = evaluator.compute_metrics_sweep(df, num_thresholds=100)
+    eer_result = evaluator.find_eer_threshold(df, precomputed=sweep_df)
     print(f"EER Threshold: {eer_result['eer_threshold']}")
     print(f"EER Value: {eer_result['eer_value']:.4f} ({eer_result['eer_value']*100:.2f}%)")
     print(f"FAR at EER: {eer_result['FAR_at_eer']:.4f}")
@@ -162,37 +190,26 @@ def main():
     
     # Generate plots
     print("Generating evaluation plots...")
-    plots = EvaluationPlots()
-    
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     
-    # Score distribution
-    print("  - Score distribution histogram...")
-    fig = plots.score_distribution_histogram(df, backend='matplotlib')
-    if fig:
-        plots.save_matplotlib_figure(fig, output_dir / f"score_distribution_{timestamp}.png")
-        plt.close(fig)
-    
-    # Genuine vs Impostor
-    print("  - Genuine vs Impostor distribution...")
-    fig = plots.genuine_vs_impostor_distribution(df, backend='matplotlib')
-    if fig:
-        plots.save_matplotlib_figure(fig, output_dir / f"genuine_impostor_{timestamp}.png")
-        plt.close(fig)
-    
-    # FAR/FRR curve
-    print("  - FAR/FRR curve...")
-    fig = plots.far_frr_curve(df, backend='matplotlib')
-    if fig:
-        plots.save_matplotlib_figure(fig, output_dir / f"far_frr_curve_{timestamp}.png")
-        plt.close(fig)
-    
-    # Accuracy curve
-    print("  - Accuracy curve...")
-    fig = plots.accuracy_curve(df, backend='matplotlib')
-    if fig:
-        plots.save_matplotlib_figure(fig, output_dir / f"accuracy_curve_{timestamp}.png")
-        plt.close(fig)
+    # (label, EvaluationPlots method, extra kwargs, output file)
+    plot_tasks = [
+        ("Score distribution histogram", 'score_distribution_histogram', {},
+         output_dir / f"score_distribution_{timestamp}.png"),
+        ("Genuine vs Impostor distribution", 'genuine_vs_impostor_distribution', {},
+         output_dir / f"genuine_impostor_{timestamp}.png"),
+        ("FAR/FRR curve", 'far_frr_curve', {'precomputed': sweep_df},
+         output_dir / f"far_frr_curve_{timestamp}.png"),
+        ("Accuracy curve", 'accuracy_curve', {'precomputed': sweep_df},
+         output_dir / f"accuracy_curve_{timestamp}.png"),
+    ]
+    for label, _, _, _ in plot_tasks:
+        print(f"  - {label}...")
+    
+    # Rendering and PNG encoding are CPU-bound and independent, so each plot gets its own process
+    with ProcessPoolExecutor(max_workers=len(plot_tasks)) as executor:
+        save_kwargs = PLOT_SAVE_HQ if args.hq else PLOT_SAVE_FAST
+        list(executor.map(_render_plot, [(df, method, kwargs, path, save_kwargs) for _, method, kwargs, path in plot_tasks]))
     
     print()
     print("=" * 60)
@@ -205,8 +222,5 @@ def main():
 
 
 if __name__ == "__main__":
-    import matplotlib
-    matplotlib.use('Agg')  # Non-interactive backend for CLI
-    import matplotlib.pyplot as plt
     sys.exit(main())
 
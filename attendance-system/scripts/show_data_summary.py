@@ -20,62 +20,61 @@ def main():
     print("=" * 60)
     print()
     
-    # Total count
-    total = db.execute_query("SELECT COUNT(*) as count FROM attendance")
-    total_count = dict(total[0])['count'] if total else 0
-    print(f"Total records: {total_count}")
-    
-    # Date range
-    date_range = db.execute_query("""
-        SELECT 
-            MIN(timestamp) as first_date,
-            MAX(timestamp) as last_date
-        FROM attendance
-    """)
-    
-    if date_range:
-        r = dict(date_range[0])
+    with db.get_connection() as conn:
+        # Older databases predate these indexes; the breakdown and daily queries can use them
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_attendance_timestamp ON attendance(timestamp)")
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_attendance_face_decision ON attendance(face_verified, system_decision)"
+        )
+        
+        # Total count and date range in one pass
+        r = conn.execute("""
+            SELECT 
+                COUNT(*) as count,
+                MIN(timestamp) as first_date,
+                MAX(timestamp) as last_date
+            FROM attendance
+        """).fetchone()
+        print(f"Total records: {r['count']}")
         print(f"Date range: {r['first_date']} to {r['last_date']}")
-    
-    print()
-    print("Breakdown by outcome:")
-    print("-" * 60)
-    
-    breakdown = db.execute_query("""
-        SELECT 
-            face_verified,
-            system_decision,
-            COUNT(*) as count
-        FROM attendance
-        GROUP BY face_verified, system_decision
-        ORDER BY face_verified DESC, system_decision
-    """)
-    
-    for row in breakdown:
-        r = dict(row)
-        face = "Genuine" if r['face_verified'] == 1 else "Impostor"
-        decision = r['system_decision'] or "NULL"
-        count = r['count']
-        print(f"  {face:10} + {decision:6} = {count:4d} records")
-    
-    print()
-    print("Records per day (last 7 days):")
-    print("-" * 60)
-    
-    daily = db.execute_query("""
-        SELECT 
-            DATE(timestamp) as date,
-            COUNT(*) as count
-        FROM attendance
-        WHERE timestamp >= datetime('now', '-7 days')
-        GROUP BY DATE(timestamp)
-        ORDER BY date DESC
-        LIMIT 7
-    """)
-    
-    for row in daily:
-        r = dict(row)
-        print(f"  {r['date']}: {r['count']:3d} records")
+        
+        print()
+        print("Breakdown by outcome:")
+        print("-" * 60)
+        
+        # Rows are sqlite3.Row, so columns are read by name straight from the cursor
+        breakdown = conn.execute("""
+            SELECT 
+                face_verified,
+                system_decision,
+                COUNT(*) as count
+            FROM attendance
+            GROUP BY face_verified, system_decision
+            ORDER BY face_verified DESC, system_decision
+        """)
+        
+        for r in breakdown:
+            face = "Genuine" if r['face_verified'] == 1 else "Impostor"
+            decision = r['system_decision'] or "NULL"
+            print(f"  {face:10} + {decision:6} = {r['count']:4d} records")
+        
+        print()
+        print("Records per day (last 7 days):")
+        print("-" * 60)
+        
+        daily = conn.execute("""
+            SELECT 
+                DATE(timestamp) as date,
+                COUNT(*) as count
+            FROM attendance
+            WHERE timestamp >= datetime('now', '-7 days')
+            GROUP BY DATE(timestamp)
+            ORDER BY date DESC
+            LIMIT 7
+        """)
+        
+        for r in daily:
+            print(f"  {r['date']}: {r['count']:3d} records")
 
 if __name__ == "__main__":
     main()
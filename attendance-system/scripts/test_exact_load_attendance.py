@@ -43,6 +43,7 @@ def test_load_attendance():
     try:
         with db.get_connection() as conn:
             cursor = conn.cursor()
+            cursor.row_factory = None
             if params:
                 cursor.execute(query, tuple(params))
             else:
@@ -55,32 +56,14 @@ def test_load_attendance():
                 print("No rows, returning empty DataFrame")
                 return pd.DataFrame()
             
-            # Convert sqlite3.Row objects to dicts
-            data = []
-            for row in rows:
-                try:
-                    if hasattr(row, 'keys'):
-                        data.append(dict(row))
-                    else:
-                        columns = [desc[0] for desc in cursor.description]
-                        data.append(dict(zip(columns, row)))
-                except Exception as row_error:
-                    print(f"Error converting row: {row_error}")
-                    print(f"Row type: {type(row)}")
-                    continue
-            
-            print(f"Data converted: {len(data)} dicts")
-            
-            if not data:
-                print("No data, returning empty DataFrame")
-                return pd.DataFrame()
-            
-            df = pd.DataFrame(data)
+            # Build columns straight from the row tuples
+            columns = [desc[0] for desc in cursor.description]
+            df = pd.DataFrame.from_records(rows, columns=columns)
             print(f"DataFrame created: {df.shape}")
             
             # Convert timestamp to datetime
             if 'timestamp' in df.columns:
-                df['timestamp'] = pd.to_datetime(df['timestamp'])
+                df['timestamp'] = pd.to_datetime(df['timestamp'], format='ISO8601', cache=True)
             
             print(f"Final DataFrame: {len(df)} rows")
             return df